@@ -0,0 +1,204 @@
+import asyncio
+import re
+from typing import Any, Dict, Literal
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from backend.code.agentic_state import CombinedResponse, ImmigrationState
+from backend.code.agent_nodes.manager_node import validate_and_sanitize_input, validation_failure_result
+from backend.code.agent_nodes.synthesis_node import detect_and_validate_language
+from backend.code.async_utils import FastQueryDetector
+from backend.code.llm import get_llm
+from backend.code.paths import APP_CONFIG_FPATH, PROMPT_CONFIG_FPATH
+from backend.code.structured_logging import fast_answer_logger, PerformanceTimer
+from backend.code.utils import load_yaml_config, get_relevant_documents, _chroma_manager
+
+config = load_yaml_config(APP_CONFIG_FPATH)
+prompt_config = load_yaml_config(PROMPT_CONFIG_FPATH)
+
+# Single-call manager+synthesis path for simple first questions (config.yaml -> performance)
+COMBINED_FAST_ANSWER = config.get("performance", {}).get("combined_fast_answer", False)
+
+# Fee and cost questions need fee_calculator_tool, which only the manager flow runs
+_FEE_QUESTION_RE = re.compile(r"\b(?:fees?|costs?|price|how much|pay)\b", re.IGNORECASE)
+
+
+def route_from_start(state: ImmigrationState) -> Literal["fast_answer", "manager"]:
+    """
+    Entry routing: simple standalone questions take the one-call fast answer
+    path; follow-ups and anything complex go through the full manager flow.
+    """
+    if not COMBINED_FAST_ANSWER or state.get("conversation_history"):
+        return "manager"
+    text = state.get("text", "")
+    if FastQueryDetector.is_simple_query(text) and not _FEE_QUESTION_RE.search(text):
+        fast_answer_logger.info("fast_answer_route_selected", session_id=state.get("session_id", ""))
+        return "fast_answer"
+    return "manager"
+
+
+def route_from_fast_answer(state: ImmigrationState) -> Literal["reviewer", "synthesizer", "manager"]:
+    """
+    Send a fast answer to the reviewer like any other synthesis; rejected
+    input goes to the synthesizer exactly as it would after the manager, and
+    any other failure falls back to the full manager flow.
+
+    Returns the target node name directly; LangGraph reads the Literal return
+    type for the edge targets, so no path map is needed.
+    """
+    if state.get("synthesis"):
+        return "reviewer"
+    if (state.get("structured_analysis") or {}).get("question_type") == "validation_error":
+        return "synthesizer"
+    return "manager"
+
+
+def _retrieve_context(question: str, session_id: str) -> str:
+    """Vector search only (no LLM call) so the combined answer stays grounded."""
+    try:
+        collection = _chroma_manager.get_collection("publications")
+        docs = get_relevant_documents(
+            question,
+            collection,
+            n_results=config["vectordb"]["n_results"],
+            threshold=config["vectordb"]["threshold"],
+        )
+    except Exception as e:
+        fast_answer_logger.warning(
+            "fast_answer_retrieval_failed",
+            session_id=session_id,
+            error_type=type(e).__name__,
+            error_message=str(e)
+        )
+        return ""
+    return "\n\n".join(docs)
+
+
+def _prepare_fast_answer(state: ImmigrationState) -> Dict[str, Any]:
+    """
+    Validate the question and build the combined prompt.
+    
+    Returns {"update": ...} when validation rejects the question or the
+    language is not supported, otherwise {"messages": ..., "rag_context": ...}
+    for the LLM call.
+    """
+    session_id = state.get("session_id", "")
+
+    validation_result = validate_and_sanitize_input(state)
+    if not validation_result["is_valid"]:
+        return {"update": validation_failure_result(validation_result)}
+    user_question = validation_result["sanitized_state"].get("text", "")
+
+    # Same detection as synthesis (it also stores the session language preference);
+    # unsupported languages fall back so synthesis can send its standard reply
+    language_info = detect_and_validate_language(user_question, [], session_id)
+    if not language_info.get("supported"):
+        fast_answer_logger.info(
+            "fast_answer_unsupported_language_falling_back",
+            session_id=session_id,
+            detected_language=language_info.get("language")
+        )
+        return {"update": {}}
+
+    synthesis_prompt_config = prompt_config.get("synthesis_agent_prompt", {})
+    system_prompt = f"""{synthesis_prompt_config.get("role", "You are an expert US Immigration Assistant.")}
+
+{synthesis_prompt_config.get("instruction", "Provide helpful immigration guidance.")}
+
+Respond in {language_info["language_name"]}.
+
+Also classify the question: give a short question_type label, its primary_focus and the visa types it is about."""
+
+    rag_context = _retrieve_context(user_question, session_id)
+    user_prompt = f'🎯 USER QUESTION: "{user_question}"'
+    if rag_context:
+        user_prompt += f"\n\n📚 OFFICIAL CONTEXT:\n{rag_context}"
+
+    return {
+        "messages": [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)],
+        "rag_context": rag_context,
+    }
+
+
+def _combined_llm():
+    """Configured chat model constrained to the CombinedResponse schema."""
+    return get_llm(config.get("llm", "gpt-4o-mini")).with_structured_output(CombinedResponse)
+
+
+def _fast_answer_failed(e: Exception, session_id: str) -> Dict[str, Any]:
+    """Log the failure; the empty update routes the question to the manager."""
+    fast_answer_logger.error(
+        "fast_answer_failed_falling_back",
+        session_id=session_id,
+        error_type=type(e).__name__,
+        error_message=str(e)
+    )
+    return {}
+
+
+def _apply_fast_answer(response: CombinedResponse, rag_context: str, session_id: str) -> Dict[str, Any]:
+    """Map the combined response onto the manager and synthesis state fields."""
+    if not response.synthesis or len(response.synthesis.strip()) < 20:
+        fast_answer_logger.warning("fast_answer_too_short_falling_back", session_id=session_id)
+        return {}
+
+    structured_analysis = {
+        "question_type": response.question_type,
+        "primary_focus": response.primary_focus,
+        "visa_focus": response.visa_focus,
+        "complexity": "simple",
+        "tools_used": [],
+        "session_aware": False,
+        "analysis_confidence": "medium"
+    }
+
+    fast_answer_logger.info(
+        "fast_answer_completed",
+        session_id=session_id,
+        question_type=response.question_type,
+        response_length=len(response.synthesis)
+    )
+
+    return {
+        "manager_decision": "Simple question answered in a single combined call.",
+        "structured_analysis": structured_analysis,
+        "workflow_parameters": structured_analysis,
+        "rag_response": rag_context,
+        "synthesis": response.synthesis,
+        "tools_used": []
+    }
+
+
+def fast_answer_node(state: ImmigrationState) -> Dict[str, Any]:
+    """
+    Produce the manager's analysis and the synthesis in one structured LLM call.
+    
+    Returns an empty update on LLM failure so route_from_fast_answer hands the
+    question to the manager.
+    """
+    session_id = state.get("session_id", "")
+    prepared = _prepare_fast_answer(state)
+    if "update" in prepared:
+        return prepared["update"]
+
+    try:
+        with PerformanceTimer(fast_answer_logger, "combined_llm_call", session_id=session_id):
+            response = _combined_llm().invoke(prepared["messages"])
+    except Exception as e:
+        return _fast_answer_failed(e, session_id)
+    return _apply_fast_answer(response, prepared["rag_context"], session_id)
+
+
+async def afast_answer_node(state: ImmigrationState) -> Dict[str, Any]:
+    """Async fast_answer_node: the LLM call is awaited; validation and retrieval run in a thread."""
+    session_id = state.get("session_id", "")
+    prepared = await asyncio.to_thread(_prepare_fast_answer, state)
+    if "update" in prepared:
+        return prepared["update"]
+
+    try:
+        with PerformanceTimer(fast_answer_logger, "combined_llm_call", session_id=session_id):
+            response = await _combined_llm().ainvoke(prepared["messages"])
+    except Exception as e:
+        return _fast_answer_failed(e, session_id)
+    return _apply_fast_answer(response, prepared["rag_context"], session_id)
@@ -1,8 +1,10 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage
 from backend.code.llm import get_llm
 from backend.code.paths import APP_CONFIG_FPATH, PROMPT_CONFIG_FPATH
 from backend.code.utils import load_yaml_config
-from backend.code.prompt_builder import build_prompt_from_config
+from backend.code.prompt_builder import build_prompt_from_config, build_prompt_messages
 from backend.code.agentic_state import ImmigrationState
 from backend.code.tools.tool_registry import get_all_tools
 from backend.code.structured_logging import manager_logger, PerformanceTimer
@@ -93,12 +95,20 @@ def validate_and_sanitize_input(state: ImmigrationState) -> Dict[str, Any]:
         "validation_warnings": validation_result.warnings
     }
 
-def build_session_aware_prompt(user_question: str, state: ImmigrationState) -> str:
-    base_prompt = build_prompt_from_config(
-        config=prompt_config["manager_agent_prompt"], 
-        input_data=user_question
-    )
-    
+def validation_failure_result(validation_result: Dict[str, Any]) -> Dict[str, Any]:
+    """State update for a question rejected by validate_and_sanitize_input."""
+    return {
+        "manager_decision": f"Input validation failed: {validation_result['error_message']}",
+        "structured_analysis": {"question_type": "validation_error"},
+        "tool_results": {},
+        "tools_used": [],
+        "rag_response": "",
+        "workflow_parameters": {"question_type": "validation_error"},
+        "validation_errors": [validation_result["error_message"]],
+        "validation_warnings": validation_result.get("warnings", [])
+    }
+
+def _conversation_context(user_question: str, state: ImmigrationState) -> str:
     # Simple, clean conversation context
     conversation_context = ""
     if state.get("conversation_history"):
@@ -107,8 +117,32 @@ def build_session_aware_prompt(user_question: str, state: ImmigrationState) -> s
             conversation_context += f"Q{i}: {turn.question}\n"
             conversation_context += f"A{i}: {turn.answer}\n\n"
         conversation_context += f"NEW QUESTION: {user_question}\n\n"
+    return conversation_context
+
+
+def build_session_aware_prompt(user_question: str, state: ImmigrationState) -> str:
+    base_prompt = build_prompt_from_config(
+        config=prompt_config["manager_agent_prompt"], 
+        input_data=user_question
+    )
     
-    return f"{conversation_context}{base_prompt}"
+    return f"{_conversation_context(user_question, state)}{base_prompt}"
+
+
+def build_session_aware_messages(user_question: str, state: ImmigrationState) -> List[BaseMessage]:
+    """
+    Same content as build_session_aware_prompt, split so the static manager
+    instructions form a stable system-message prefix that the provider can
+    cache across turns; history and the new question go in the human message.
+    """
+    system_message, human_message = build_prompt_messages(
+        config=prompt_config["manager_agent_prompt"],
+        input_data=user_question
+    )
+    conversation_context = _conversation_context(user_question, state)
+    if conversation_context:
+        human_message = HumanMessage(content=f"{conversation_context}{human_message.content}")
+    return [system_message, human_message]
    
 
 def manager_node(state: ImmigrationState) -> Dict[str, Any]:
@@ -134,16 +168,7 @@ def manager_node(state: ImmigrationState) -> Dict[str, Any]:
         validation_result = validate_and_sanitize_input(state)
         
         if not validation_result["is_valid"]:
-            return {
-                "manager_decision": f"Input validation failed: {validation_result['error_message']}",
-                "structured_analysis": {"question_type": "validation_error"},
-                "tool_results": {},
-                "tools_used": [],
-                "rag_response": "",
-                "workflow_parameters": {"question_type": "validation_error"},
-                "validation_errors": [validation_result["error_message"]],
-                "validation_warnings": validation_result.get("warnings", [])
-            }
+            return validation_failure_result(validation_result)
         
         # Use sanitized state
         sanitized_state = validation_result["sanitized_state"]
@@ -164,7 +189,7 @@ def manager_node(state: ImmigrationState) -> Dict[str, Any]:
         
         # Step 3: Build prompt with session awareness
         with PerformanceTimer(manager_logger, "prompt_building", session_id=session_id):
-            prompt = build_session_aware_prompt(user_question, sanitized_state)
+            prompt = build_session_aware_messages(user_question, sanitized_state)
         
         # Step 4: LLM analysis with retry logic
         try:
@@ -1,3 +1,7 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
 from backend.code.agent_nodes.rag_retrieval_agent.config_loader import (
     load_app_config,
     load_prompt_config,
@@ -7,13 +11,19 @@ from backend.code.agent_nodes.rag_retrieval_agent.memory import make_memory
 from backend.code.tools.rag_prompt_utils import build_query_prompt
 from backend.code.utils import get_collection, get_relevant_documents, initialize_chroma_db, _chroma_manager
 from backend.code.llm import get_llm
+from backend.code.async_utils import _async_manager
+
+# Max concurrent achat calls per event loop
+ACHAT_MAX_CONCURRENCY = 8
+_achat_semaphores = weakref.WeakKeyDictionary()
 
 
 def respond_to_query(llm: str, prompt: str) -> str:
     model = get_llm(llm, temperature=0.2)
     return model.invoke(prompt).content
 
-def chat(session_id: str, question: str) -> str:
+def build_chat_prompt(session_id: str, question: str) -> Tuple[str, Any]:
+    """Retrieve context and build the RAG prompt; returns (prompt, memory)."""
     setup_logging()
     app_cfg = load_app_config()
     prompt_cfg = load_prompt_config()
@@ -32,6 +42,44 @@ def chat(session_id: str, question: str) -> str:
     prompt = build_query_prompt(
         prompt_cfg["rag_assistant_prompt"], docs, question, history
     )
-    answer = respond_to_query(app_cfg["llm"], prompt)
+    return prompt, mem
+
+
+def chat(session_id: str, question: str) -> str:
+    prompt, mem = build_chat_prompt(session_id, question)
+    answer = respond_to_query(load_app_config()["llm"], prompt)
     mem.save_context({"question": question}, {"answer": answer})
     return answer
+
+
+def _achat_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _achat_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _achat_semaphores[loop] = asyncio.Semaphore(ACHAT_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def achat(
+    session_id: str,
+    question: str,
+    submit: Optional[Callable[[str], Awaitable[str]]] = None,
+) -> str:
+    """
+    Async chat: the LLM call is awaited natively; only the sync Chroma
+    retrieval and memory I/O use a worker thread.
+
+    submit: optional coroutine function taking the prompt and returning the
+    answer text (e.g. BatchingLLMClient.submit); defaults to the cached model's ainvoke.
+    """
+    async with _achat_semaphore():
+        prompt, mem = await _async_manager.run_in_executor(build_chat_prompt, session_id, question)
+        if submit is not None:
+            answer = await submit(prompt)
+        else:
+            model = _async_manager.get_cached_llm(load_app_config()["llm"], 0.2)
+            answer = (await model.ainvoke(prompt)).content
+        await _async_manager.run_in_executor(
+            mem.save_context, {"question": question}, {"answer": answer}
+        )
+        return answer
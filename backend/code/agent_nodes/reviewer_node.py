@@ -1,6 +1,9 @@
-from typing import Dict, Any, Literal
+from typing import Dict, Any, List, Literal, Optional, Tuple
 
-from backend.code.prompt_builder import build_prompt_from_config
+from langchain_core.messages import BaseMessage
+from langgraph.constants import END
+
+from backend.code.prompt_builder import build_prompt_messages
 from backend.code.paths import APP_CONFIG_FPATH, PROMPT_CONFIG_FPATH
 from backend.code.utils import load_yaml_config
 config = load_yaml_config(APP_CONFIG_FPATH)
@@ -9,14 +12,40 @@ from backend.code.agentic_state import ImmigrationState, ReviewOutput
 from backend.code.llm import get_llm
 from backend.code.structured_logging import reviewer_logger, PerformanceTimer
 
+MAX_REVISIONS = 1  # Revision rounds the reviewer may request; later drafts are approved as-is
 
-def reviewer_node(state: ImmigrationState) -> Dict[str, Any]:
+
+def _final_round_approval(state: ImmigrationState) -> Optional[Dict[str, Any]]:
     """
-    Reviewer node that evaluates the quality and completeness of all processing results.
+    Approval update once revisions are exhausted, or None if the LLM should review.
+    
+    Past MAX_REVISIONS no further revision can be requested, so the verdict
+    could not change the route - skip the call entirely.
     """
+    revision_round = state.get("revision_round", 0) + 1
+    if revision_round <= MAX_REVISIONS:
+        return None
+
+    reviewer_logger.info(
+        "review_skipped_final_round",
+        session_id=state.get("session_id", ""),
+        revision_round=revision_round,
+        max_revisions=MAX_REVISIONS
+    )
+    return {
+        "needs_revision": False,
+        "revision_round": revision_round,
+        "rag_retriever_approved": True,
+        "synthesis_approved": True,
+        "references_approved": True,
+    }
+
+
+def _prepare_review(state: ImmigrationState) -> Tuple[Any, List[BaseMessage], int, str]:
+    """Build the structured reviewer LLM and prompt; shared by the sync and async nodes."""
     # Track revision rounds
     revision_round = state.get("revision_round", 0) + 1
-    max_revisions = 1  # Limit to prevent infinite loops - quality control needs multiple rounds
+    max_revisions = MAX_REVISIONS
     session_id = state.get("session_id", "")
 
     reviewer_logger.info(
@@ -40,128 +69,150 @@ def reviewer_node(state: ImmigrationState) -> Dict[str, Any]:
     - References: {state.get("references", [])}
     """
 
-    prompt = build_prompt_from_config(
+    prompt = build_prompt_messages(
         config=prompt_config["reviewer_agent_prompt"], input_data=review_input
     )
+    return llm, prompt, revision_round, session_id
 
-    try:
-        with PerformanceTimer(reviewer_logger, "llm_review", session_id=session_id):
-            response = llm.invoke(prompt)
 
-        # Handle individual component approvals
-        overall_approved = (
-                response.rag_retriever_approved
-                and response.synthesis_approved
-                and response.references_approved
-        )
+def _apply_review(response: ReviewOutput, revision_round: int, session_id: str) -> Dict[str, Any]:
+    """Turn the reviewer's verdict into the state update."""
+    # Handle individual component approvals
+    overall_approved = (
+            response.rag_retriever_approved
+            and response.synthesis_approved
+            and response.references_approved
+    )
 
-        # Force approval if we've reached max revisions to prevent infinite loops
-        if revision_round >= max_revisions and not overall_approved:
-            reviewer_logger.warning(
-                "max_revisions_reached_forcing_approval",
-                session_id=session_id,
-                revision_round=revision_round,
-                max_revisions=max_revisions
-            )
-            overall_approved = True  # Force approve all remaining components
-            response.rag_retriever_approved = True
-            response.synthesis_approved = True
-            response.references_approved = True
-
-        status = "approved" if overall_approved else "needs_revision"
+    # Rounds past MAX_REVISIONS never get here (_final_round_approval approves
+    # them without a review), so a rejection can always be acted on
+    status = "approved" if overall_approved else "needs_revision"
+
+    reviewer_logger.info(
+        "review_completed",
+        session_id=session_id,
+        status=status,
+        revision_round=revision_round,
+        rag_approved=response.rag_retriever_approved,
+        synthesis_approved=response.synthesis_approved,
+        references_approved=response.references_approved
+    )
+
+    if not overall_approved:
+        needs_revision_list = []
+        if not response.rag_retriever_approved:
+            needs_revision_list.append("RAG")
+        if not response.synthesis_approved:
+            needs_revision_list.append("Synthesis")
+        if not response.references_approved:
+            needs_revision_list.append("References")
 
         reviewer_logger.info(
-            "review_completed",
+            "components_need_revision",
             session_id=session_id,
-            status=status,
             revision_round=revision_round,
-            rag_approved=response.rag_retriever_approved,
-            synthesis_approved=response.synthesis_approved,
-            references_approved=response.references_approved
+            components_needing_revision=needs_revision_list
         )
 
-        if not overall_approved:
-            needs_revision_list = []
-            if not response.rag_retriever_approved:
-                needs_revision_list.append("RAG")
-            if not response.synthesis_approved:
-                needs_revision_list.append("Synthesis")
-            if not response.references_approved:
-                needs_revision_list.append("References")
-
-            reviewer_logger.info(
-                "components_need_revision",
-                session_id=session_id,
-                revision_round=revision_round,
-                components_needing_revision=needs_revision_list
-            )
-
-            return {
-                "needs_revision": True,
-                "revision_round": revision_round,
-                "rag_retriever_feedback": response.rag_retriever_feedback,
-                "synthesis_feedback": response.synthesis_feedback,
-                "references_feedback": response.references_feedback,
-                "rag_retriever_approved": response.rag_retriever_approved,
-                "synthesis_approved": response.synthesis_approved,
-                "references_approved": response.references_approved,
-            }
-        else:
-            reviewer_logger.info(
-                "all_components_approved",
-                session_id=session_id,
-                revision_round=revision_round
-            )
-
-            return {
-                "needs_revision": False,
-                "revision_round": revision_round,
-                "rag_retriever_feedback": response.rag_retriever_feedback,
-                "synthesis_feedback": response.synthesis_feedback,
-                "references_feedback": response.references_feedback,
-                "rag_retriever_approved": response.rag_retriever_approved,
-                "synthesis_approved": response.synthesis_approved,
-                "references_approved": response.references_approved,
-            }
-    except Exception as e:
-        reviewer_logger.error(
-            "review_process_failed",
+        return {
+            "needs_revision": True,
+            "revision_round": revision_round,
+            "rag_retriever_feedback": response.rag_retriever_feedback,
+            "synthesis_feedback": response.synthesis_feedback,
+            "references_feedback": response.references_feedback,
+            "rag_retriever_approved": response.rag_retriever_approved,
+            "synthesis_approved": response.synthesis_approved,
+            "references_approved": response.references_approved,
+        }
+    else:
+        reviewer_logger.info(
+            "all_components_approved",
             session_id=session_id,
-            revision_round=revision_round,
-            error_type=type(e).__name__,
-            error_message=str(e)
+            revision_round=revision_round
         )
+
         return {
-            "review_feedback": "Review process failed.",
-            "final_output": {},
             "needs_revision": False,
             "revision_round": revision_round,
+            "rag_retriever_feedback": response.rag_retriever_feedback,
+            "synthesis_feedback": response.synthesis_feedback,
+            "references_feedback": response.references_feedback,
+            "rag_retriever_approved": response.rag_retriever_approved,
+            "synthesis_approved": response.synthesis_approved,
+            "references_approved": response.references_approved,
         }
 
+
+def _review_failed(e: Exception, revision_round: int, session_id: str) -> Dict[str, Any]:
+    """State update when the review call fails: log it and let the answer through."""
+    reviewer_logger.error(
+        "review_process_failed",
+        session_id=session_id,
+        revision_round=revision_round,
+        error_type=type(e).__name__,
+        error_message=str(e)
+    )
+    return {
+        "review_feedback": "Review process failed.",
+        "final_output": {},
+        "needs_revision": False,
+        "revision_round": revision_round,
+    }
+
+
+def reviewer_node(state: ImmigrationState) -> Dict[str, Any]:
+    """
+    Reviewer node that evaluates the quality and completeness of all processing results.
+    """
+    final_round = _final_round_approval(state)
+    if final_round is not None:
+        return final_round
+
+    llm, prompt, revision_round, session_id = _prepare_review(state)
+    try:
+        with PerformanceTimer(reviewer_logger, "llm_review", session_id=session_id):
+            response = llm.invoke(prompt)
+        return _apply_review(response, revision_round, session_id)
+    except Exception as e:
+        return _review_failed(e, revision_round, session_id)
+
+
+async def areviewer_node(state: ImmigrationState) -> Dict[str, Any]:
+    """Async reviewer_node: awaits the LLM instead of holding a worker thread under ainvoke."""
+    final_round = _final_round_approval(state)
+    if final_round is not None:
+        return final_round
+
+    llm, prompt, revision_round, session_id = _prepare_review(state)
+    try:
+        with PerformanceTimer(reviewer_logger, "llm_review", session_id=session_id):
+            response = await llm.ainvoke(prompt)
+        return _apply_review(response, revision_round, session_id)
+    except Exception as e:
+        return _review_failed(e, revision_round, session_id)
+
 def route_from_reviewer(
         state: ImmigrationState,
-) -> Literal["synthesis", "end"]:
+) -> Literal["synthesizer", "__end__"]:
     """
     Conditional routing function that determines whether to dispatch revisions or end.
+
+    Returns the target node name directly; LangGraph reads the Literal return
+    type for the edge targets, so no path map is needed.
     """
-    needs_revision = state.get("needs_revision", False)
-    rag_retriever_approved = state.get("rag_retriever_approved", False)
-    synthesis_approved = state.get("synthesis_approved", False)
-    references_approved = state.get("references_approved", False)
     session_id = state.get("session_id", "")
 
-    if not needs_revision:
+    if not state.get("needs_revision", False):
         reviewer_logger.info("routing_to_end", session_id=session_id)
-        return "end"
-    else:
-        reviewer_logger.info(
-            "routing_to_revision",
-            session_id=session_id,
-            rag_approved=rag_retriever_approved,
-            synthesis_approved=synthesis_approved,
-            references_approved=references_approved
-        )
-        # In the simplified architecture, all revisions go through synthesis
-        # which will use appropriate tools (RAG, web search, fee calculator)
-        reviewer_logger.info("routing_to_synthesis_for_revision", session_id=session_id)
-        return "synthesis"
\ No newline at end of file
+        return END
+
+    # In the simplified architecture, all revisions go through synthesis
+    # which will use appropriate tools (RAG, web search, fee calculator)
+    reviewer_logger.info(
+        "routing_to_synthesis_for_revision",
+        session_id=session_id,
+        rag_approved=state.get("rag_retriever_approved", False),
+        synthesis_approved=state.get("synthesis_approved", False),
+        references_approved=state.get("references_approved", False)
+    )
+    return "synthesizer"
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Collection, Dict, Any
+from langchain_core.messages import HumanMessage, SystemMessage
 from backend.code.prompt_builder import build_prompt_from_config
 from backend.code.agentic_state import ImmigrationState
 from backend.code.llm import get_llm
@@ -10,6 +11,14 @@ from fast_langdetect import detect
 config = load_yaml_config(APP_CONFIG_FPATH)
 prompt_config = load_yaml_config(PROMPT_CONFIG_FPATH)
 
+# Tags the answer-generating LLM call so streamers can pick its tokens out of graph events
+SYNTHESIS_ANSWER_TAG = "synthesis_answer"
+
+# Tool fan-out settings (config.yaml -> performance); the graph's Send fan-out
+# runs tools in parallel, bounded by max_concurrent_tools
+PARALLEL_TOOL_EXECUTION = config.get("performance", {}).get("parallel_tool_execution", False)
+MAX_CONCURRENT_TOOLS = config.get("performance", {}).get("max_concurrent_tools", 2)
+
 
 def detect_and_validate_language(user_question: str, conversation_history: list, session_id: str) -> Dict[str, Any]:
     """
@@ -25,7 +34,6 @@ def detect_and_validate_language(user_question: str, conversation_history: list,
     """
     
     from backend.code.session_manager import session_manager
-    from fast_langdetect import detect, detect_multilingual
     
     synthesis_logger.info(
         "language_detection_started",
@@ -220,12 +228,12 @@ def synthesis_node(state: ImmigrationState) -> Dict[str, Any]:
         session_id=session_id
     )
     
-    tool_results = {}
-    tools_used = []
-    
+    # With the parallel fan-out active the tools have already run upstream;
+    # their outcomes (errors included) are reused rather than run again here
     with PerformanceTimer(synthesis_logger, "tool_execution_phase", session_id=session_id):
         tool_results, tools_used = execute_manager_recommended_tools(
-            manager_decision, user_question, session_id
+            manager_decision, user_question, session_id, state.get("tool_results"),
+            attempted=state.get("fanout_tools_attempted") or ()
         )
 
     synthesis_logger.info(
@@ -343,8 +351,8 @@ def synthesis_node(state: ImmigrationState) -> Dict[str, Any]:
     synthesis_logger.info(
         "step_4_completed_prompt_creation",
         session_id=session_id,
-        prompt_length=len(prompt),
-        prompt_preview=prompt[:100] + "..." if len(prompt) > 100 else prompt
+        prompt_length=sum(len(message.content) for message in prompt),
+        prompt_preview=prompt[-1].content[:100] + "..." if len(prompt[-1].content) > 100 else prompt[-1].content
     )
     
     # Step 5: Use LLM without tool calling to avoid errors
@@ -357,7 +365,7 @@ def synthesis_node(state: ImmigrationState) -> Dict[str, Any]:
         llm = get_llm(config.get("llm", "gpt-4o-mini"))
         # CRITICAL: Don't bind tools to avoid the tool calling errors
         with PerformanceTimer(synthesis_logger, "llm_generation", session_id=session_id):
-            response = llm.invoke(prompt)
+            response = llm.invoke(prompt, config={"tags": [SYNTHESIS_ANSWER_TAG]})
             synthesis_content = response.content
         
         synthesis_logger.info(
@@ -455,15 +463,27 @@ A: {turn.answer[:300]}{'...' if len(turn.answer) > 300 else ''}
     
     return context
 
-def execute_manager_recommended_tools(manager_decision: str, user_question: str, session_id: str) -> tuple:
+def is_usable_tool_result(result: Any) -> bool:
+    """True for a tool result that ran successfully (not missing, not an error dict)."""
+    return result is not None and not (isinstance(result, dict) and "error" in result)
+
+
+def execute_manager_recommended_tools(manager_decision: str, user_question: str, session_id: str,
+                                      prefetched: Dict[str, Any] = None,
+                                      attempted: Collection[str] = ()) -> tuple:
     """
     Parse manager's tool recommendations and execute appropriate tools.
     
+    Successful results already in prefetched (from the manager or the parallel
+    tool fan-out) are reused instead of running the tool again. Tools the
+    fan-out already attempted are not retried; their error result is kept.
+    
     Returns:
         tuple: (tool_results dict, tools_used list)
     """
     tool_results = {}
     tools_used = []
+    prefetched = prefetched or {}
     
     # Get available tools for synthesis agent
     available_tools = get_tools_by_agent("synthesis")
@@ -485,58 +505,90 @@ def execute_manager_recommended_tools(manager_decision: str, user_question: str,
         recommended_tools=recommended_tools
     )
     
-    # Execute each recommended tool
-    for tool_name in recommended_tools:
-        if tool_name in tool_map:
-            try:
-                tool = tool_map[tool_name]
-                
-                synthesis_logger.info(
-                    "executing_recommended_tool",
-                    tool_name=tool_name,
-                    session_id=session_id
-                )
-                
-                # Create appropriate tool arguments based on tool type
-                if tool_name == "web_search_tool":
-                    tool_args = {"query": user_question}
-                elif tool_name == "fee_calculator_tool":
-                    tool_args = {"query": user_question}
-                elif tool_name == "rag_retrieval_tool":
-                    tool_args = {"query": user_question}
-                else:
-                    tool_args = {"query": user_question}
-                
-                with PerformanceTimer(synthesis_logger, f"tool_{tool_name}", session_id=session_id):
-                    result = tool.invoke(tool_args)
-                    tool_results[tool_name] = result
-                    tools_used.append(tool_name)
-                
-                synthesis_logger.info(
-                    "tool_execution_successful",
-                    tool_name=tool_name,
-                    session_id=session_id,
-                    result_length=len(str(result))
-                )
-                
-            except Exception as e:
-                synthesis_logger.error(
-                    "tool_execution_failed",
-                    tool_name=tool_name,
-                    session_id=session_id,
-                    error_message=str(e)
-                )
-                tool_results[tool_name] = {"error": str(e)}
-        else:
-            synthesis_logger.warning(
-                "recommended_tool_not_available",
-                tool_name=tool_name,
-                session_id=session_id,
-                available_tools=list(tool_map.keys())
-            )
+    reused_tools = [name for name in recommended_tools if is_usable_tool_result(prefetched.get(name))]
+    if reused_tools:
+        synthesis_logger.info(
+            "reusing_prefetched_tool_results",
+            session_id=session_id,
+            reused_tools=reused_tools
+        )
+    
+    def run_or_reuse(name):
+        if name in reused_tools:
+            return True, True, prefetched[name]
+        if name in attempted:
+            return name in prefetched, False, prefetched.get(name)
+        return run_recommended_tool(name, tool_map, user_question, session_id)
+    
+    # Parallel execution happens in the graph's tool fan-out; anything left runs here in order
+    outcomes = [run_or_reuse(name) for name in recommended_tools]
+    
+    # Merge in recommendation order so output matches sequential execution
+    for tool_name, (available, succeeded, result) in zip(recommended_tools, outcomes):
+        if not available:
+            continue
+        tool_results[tool_name] = result
+        if succeeded:
+            tools_used.append(tool_name)
     
     return tool_results, tools_used
 
+
+def run_recommended_tool(tool_name: str, tool_map: dict, user_question: str, session_id: str) -> tuple:
+    """
+    Execute one recommended tool.
+    
+    Returns:
+        tuple: (tool available, execution succeeded, result or error dict)
+    """
+    if tool_name not in tool_map:
+        synthesis_logger.warning(
+            "recommended_tool_not_available",
+            tool_name=tool_name,
+            session_id=session_id,
+            available_tools=list(tool_map.keys())
+        )
+        return False, False, None
+    
+    try:
+        tool = tool_map[tool_name]
+        
+        synthesis_logger.info(
+            "executing_recommended_tool",
+            tool_name=tool_name,
+            session_id=session_id
+        )
+        
+        # Create appropriate tool arguments based on tool type
+        if tool_name == "web_search_tool":
+            tool_args = {"query": user_question}
+        elif tool_name == "fee_calculator_tool":
+            tool_args = {"query": user_question}
+        elif tool_name == "rag_retrieval_tool":
+            tool_args = {"query": user_question}
+        else:
+            tool_args = {"query": user_question}
+        
+        with PerformanceTimer(synthesis_logger, f"tool_{tool_name}", session_id=session_id):
+            result = tool.invoke(tool_args)
+        
+        synthesis_logger.info(
+            "tool_execution_successful",
+            tool_name=tool_name,
+            session_id=session_id,
+            result_length=len(str(result))
+        )
+        return True, True, result
+        
+    except Exception as e:
+        synthesis_logger.error(
+            "tool_execution_failed",
+            tool_name=tool_name,
+            session_id=session_id,
+            error_message=str(e)
+        )
+        return True, False, {"error": str(e)}
+
 def parse_tool_recommendations(manager_decision: str, user_question: str) -> list:
     """
     Parse the manager's structured decision to extract tool recommendations.
@@ -648,14 +700,15 @@ def create_dynamic_synthesis_prompt(user_question, rag_context, session_context,
     if manager_decision:
         manager_guidance = f"\n📋 STRATEGIC GUIDANCE:\n{manager_decision[:500]}{'...' if len(manager_decision) > 500 else ''}\n"
 
-    # Construct the universal prompt
-    full_prompt = f"""{role}
-
-{current_info_override}
+    # Role and instruction only depend on config, so they form a stable system
+    # prefix the provider can cache; everything per-turn goes in the human message
+    system_prompt = f"""{role}
 
 {instruction}
 
-🎯 USER QUESTION: "{user_question}"
+IMPORTANT: Follow the length guidelines and respond in the same language as the user's question."""
+
+    user_prompt = f"""🎯 USER QUESTION: "{user_question}"
 
 {session_context}
 
@@ -664,20 +717,21 @@ def create_dynamic_synthesis_prompt(user_question, rag_context, session_context,
 
 {tool_results_text}
 
+{current_info_override}
+
 {manager_guidance}
 
-IMPORTANT: Follow the length guidelines and respond in the same language as the user's question.
 Final verification: {verification_note}"""
     
     synthesis_logger.info(
         "universal_prompt_completed",
         detected_language=detected_language,
-        prompt_length=len(full_prompt),
+        prompt_length=len(system_prompt) + len(user_prompt),
         has_current_info=current_info_available,
         verification_language=detected_language
     )
     
-    return full_prompt
+    return [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
 
 def create_fallback_response(user_question, conversation_history, is_followup, rag_context):
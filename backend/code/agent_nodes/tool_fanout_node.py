@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Dict, List, Union
+
+from langgraph.types import Send
+
+from backend.code.agentic_state import ImmigrationState
+from backend.code.agent_nodes.synthesis_node import (
+    MAX_CONCURRENT_TOOLS,
+    PARALLEL_TOOL_EXECUTION,
+    is_usable_tool_result,
+    parse_tool_recommendations,
+    run_recommended_tool,
+)
+from backend.code.tools.tool_registry import get_tools_by_agent
+from backend.code.structured_logging import workflow_logger
+
+# Caps tool_worker branches in flight across the process; the rest of the
+# graph runs unbounded
+_TOOL_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_TOOLS)
+
+
+def dispatch_recommended_tools(state: ImmigrationState) -> Union[str, List[Send]]:
+    """
+    Conditional edge after the manager: fan the recommended tools out to
+    parallel tool_worker branches, or go straight to synthesis when there is
+    nothing left to run (or parallel execution is disabled in config).
+    """
+    session_id = state.get("session_id", "")
+    if not PARALLEL_TOOL_EXECUTION:
+        return "synthesizer"
+
+    user_question = state.get("text", "")
+    existing = state.get("tool_results") or {}
+    pending = [
+        tool_name
+        for tool_name in parse_tool_recommendations(state.get("manager_decision") or "", user_question)
+        if not is_usable_tool_result(existing.get(tool_name))
+    ]
+
+    if not pending:
+        workflow_logger.info("tool_fanout_skipped", session_id=session_id)
+        return "synthesizer"
+
+    workflow_logger.info("tool_fanout_dispatched", session_id=session_id, tools=pending)
+    return [
+        Send("tool_worker", {"tool_name": tool_name, "text": user_question, "session_id": session_id})
+        for tool_name in pending
+    ]
+
+
+def tool_worker_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one recommended tool; results from all branches are merged into
+    tool_results by the state reducer before synthesis runs.
+    
+    The attempt is recorded even when the tool fails or is unavailable so
+    synthesis reuses the outcome instead of running the tool again.
+    """
+    tool_name = task["tool_name"]
+    tool_map = {tool.name: tool for tool in get_tools_by_agent("synthesis")}
+    with _TOOL_SLOTS:
+        available, _, result = run_recommended_tool(
+            tool_name, tool_map, task.get("text", ""), task.get("session_id", "")
+        )
+    update: Dict[str, Any] = {"fanout_tools_attempted": [tool_name]}
+    if available:
+        update["tool_results"] = {tool_name: result}
+    return update
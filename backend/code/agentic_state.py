@@ -1,5 +1,5 @@
-from typing import TypedDict, List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Callable, TypedDict, List, Dict, Any, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
 class ConversationTurn(BaseModel):
@@ -19,10 +19,40 @@ class SessionContext(BaseModel):
     ongoing_topics: List[str] = Field(default_factory=list, description="Topics discussed in session")
     visa_types_mentioned: List[str] = Field(default_factory=list, description="Visa types mentioned")
     user_situation: Optional[str] = Field(default=None, description="User's immigration situation")
+    # May be rendered lazily - read it through get_previous_questions_summary()
     previous_questions_summary: Optional[str] = Field(default=None, description="Summary of previous questions")
+    _summary_factory: Optional[Callable[[], str]] = PrivateAttr(default=None)
     
     class Config:
         arbitrary_types_allowed = True
+    
+    @classmethod
+    def with_lazy_summary(cls, summary_factory: Callable[[], str], **fields: Any) -> "SessionContext":
+        """Build a context whose summary is rendered on first read instead of up front."""
+        context = cls(**fields)
+        context._summary_factory = summary_factory
+        return context
+    
+    def get_previous_questions_summary(self) -> Optional[str]:
+        """Return the summary, rendering it from the lazy factory on first call."""
+        if self.previous_questions_summary is None and self._summary_factory is not None:
+            self.previous_questions_summary = self._summary_factory()
+            self._summary_factory = None
+        return self.previous_questions_summary
+
+def merge_tool_results(
+    left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Reducer for tool_results so parallel tool branches each add their own keys."""
+    return {**(left or {}), **(right or {})}
+
+
+def merge_attempted_tools(left: Optional[List[str]], right: Optional[List[str]]) -> List[str]:
+    """Reducer for fanout_tools_attempted so each tool branch appends its own name."""
+    merged = list(left or [])
+    merged.extend(name for name in (right or []) if name not in merged)
+    return merged
+
 
 class ImmigrationState(TypedDict, total=False):
     """Enhanced state class for immigration processing workflow with session support."""
@@ -48,8 +78,9 @@ class ImmigrationState(TypedDict, total=False):
     rag_response: Optional[str]  # RAG retrieval results
     
     # Tool coordination
-    tool_results: Optional[Dict[str, Any]]  # All tool execution results
+    tool_results: Annotated[Optional[Dict[str, Any]], merge_tool_results]  # All tool execution results (merged across branches)
     tools_used: Optional[List[str]]  # List of tools actually used
+    fanout_tools_attempted: Annotated[Optional[List[str]], merge_attempted_tools]  # Tools the parallel fan-out already ran (success or error)
     
     # Workflow metadata
     question_type: Optional[str]  # Type of immigration question
@@ -98,4 +129,11 @@ class ReviewOutput(BaseModel):
     synthesis_approved: bool = Field(description="Whether the synthesis is approved")
     synthesis_feedback: str = Field(description="Specific feedback for the synthesis")
     references_approved: bool = Field(description="Whether the references are approved")
-    references_feedback: str = Field(description="Specific feedback for the references")
\ No newline at end of file
+    references_feedback: str = Field(description="Specific feedback for the references")
+
+class CombinedResponse(BaseModel):
+    """Analysis and answer produced together by the single-call fast answer path."""
+    question_type: str = Field(description="Short label for the kind of immigration question, e.g. 'visa_definition'")
+    primary_focus: str = Field(description="Main topic the question is about")
+    visa_focus: List[str] = Field(default_factory=list, description="Visa types the question is about, e.g. ['H-1B']")
+    synthesis: str = Field(description="The complete user-facing answer, in the language of the question")
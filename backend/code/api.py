@@ -131,13 +131,16 @@ def get_session_qa(client_fingerprint: Optional[str] = Query(None)):
         sessions = filtered_sessions
         logger.info(f"Filtered to {len(sessions)} sessions for client fingerprint")
         
-        # Build response with Q&A data
+        # Build response with Q&A data; one query for all of the client's sessions
+        qa_by_session = session_manager.get_answers_by_sessions(
+            [session["session_id"] for session in sessions], limit=1000
+        )
         grouped = []
         for session in sessions:
             session_id = session["session_id"]
-            turns = session_manager.load_conversation_history(session_id, limit=1000)
-            questions = [turn.question for turn in turns]
-            answers = [turn.answer for turn in turns]
+            turns = qa_by_session[session_id]
+            questions = [turn["question"] for turn in turns]
+            answers = [turn["answer"] for turn in turns]
             grouped.append(
                 SessionQA(session_id=session_id, questions=questions, answers=answers)
             )
@@ -2,13 +2,18 @@
 Async utilities for parallel processing to improve performance.
 """
 import asyncio
+import atexit
 import concurrent.futures
+import hashlib
+import re
+import threading
 import time
 from contextlib import asynccontextmanager
 from functools import wraps, lru_cache
 from typing import Dict, Any, List, Callable, Optional
 
-from backend.code.llm import get_llm
+from backend.code.llm import build_llm
+from backend.code.structured_logging import performance_logger
 from backend.code.utils import performance_timer
 
 
@@ -18,6 +23,9 @@ class AsyncPerformanceManager:
     def __init__(self):
         self._executor = None
         self._llm_cache = {}
+        self._http_client = None
+        # One pooled AsyncClient per event loop - its connections belong to the loop that opened them
+        self._async_http_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
         
     def get_executor(self):
         """Get or create thread pool executor."""
@@ -27,7 +35,7 @@ class AsyncPerformanceManager:
     
     async def run_in_executor(self, func, *args, **kwargs):
         """Run sync function in executor thread."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         executor = self.get_executor()
         
         # Create a wrapper that handles kwargs
@@ -36,11 +44,85 @@ class AsyncPerformanceManager:
             
         return await loop.run_in_executor(executor, wrapper)
     
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+    
+    def get_http_clients(self) -> Dict[str, Any]:
+        """
+        Keep-alive HTTP clients so LLM calls reuse TCP+TLS connections.
+        
+        The sync client is shared process-wide. The async client belongs to
+        the calling event loop and is only included when one is running.
+        """
+        import httpx
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        if self._http_client is None:
+            self._http_client = httpx.Client(limits=limits, timeout=30)
+            atexit.register(self.close_http_clients)
+        clients = {"http_client": self._http_client}
+        
+        loop = self._running_loop()
+        if loop is None:
+            return clients
+        async_client = self._async_http_clients.get(loop)
+        if async_client is None:
+            self._forget_closed_loops()
+            async_client = httpx.AsyncClient(limits=limits, timeout=30)
+            self._async_http_clients[loop] = async_client
+        clients["http_async_client"] = async_client
+        return clients
+    
+    def _forget_closed_loops(self):
+        """Drop clients and models of loops that closed without calling aclose_http_clients."""
+        for loop in [loop for loop in self._async_http_clients if loop.is_closed()]:
+            self._drop_loop(loop)
+    
+    def _drop_loop(self, loop: asyncio.AbstractEventLoop):
+        for cache_key in [key for key in self._llm_cache if key[2] is loop]:
+            del self._llm_cache[cache_key]
+        return self._async_http_clients.pop(loop, None)
+    
+    async def aclose_http_clients(self):
+        """Close the calling loop's async HTTP client; call it from the loop's shutdown hook."""
+        async_client = self._drop_loop(asyncio.get_running_loop())
+        if async_client is not None:
+            await async_client.aclose()
+    
+    def close_http_clients(self):
+        """Close the shared HTTP clients (registered with atexit), each async one on its own loop."""
+        for loop in list(self._async_http_clients):
+            async_client = self._drop_loop(loop)
+            try:
+                if loop is self._running_loop():
+                    continue  # Can't block on our own loop; its shutdown hook closes it
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(async_client.aclose(), loop).result(timeout=5)
+                elif not loop.is_closed():
+                    loop.run_until_complete(async_client.aclose())
+            except Exception:
+                pass  # The process is going away anyway
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            client.close()
+    
     def get_cached_llm(self, model_name: str, temperature: float = 0.2):
-        """Cache LLM instances to avoid re-initialization."""
-        cache_key = f"{model_name}_{temperature}"
+        """
+        Cache LLM instances to avoid re-initialization.
+        
+        Pooled models are cached per event loop so each one uses its own
+        loop's async HTTP client. Gemini (the shipped default) manages its
+        own transport, so it is not pooled and one instance serves all loops.
+        """
+        # Gemini uses its own gRPC/REST transport; pool HTTP for the rest
+        pooled = not model_name.startswith("gemini")
+        cache_key = (model_name, temperature, self._running_loop() if pooled else None)
         if cache_key not in self._llm_cache:
-            self._llm_cache[cache_key] = get_llm(model_name, temperature)
+            client_kwargs = self.get_http_clients() if pooled else {}
+            self._llm_cache[cache_key] = build_llm(model_name, temperature, **client_kwargs)
         return self._llm_cache[cache_key]
 
 
@@ -56,25 +138,34 @@ async def async_performance_timer(operation_name: str):
         yield
     finally:
         duration = time.time() - start
-        print(f"ASYNC_PERF: {operation_name} took {duration:.3f}s")
+        performance_logger.debug("async_operation_timed", operation=operation_name,
+                                 duration_ms=round(duration * 1000, 2))
 
 
 async def parallel_llm_calls(calls: List[Dict[str, Any]]) -> List[Any]:
     """
     Execute multiple LLM calls in parallel.
     
+    Calls that share a model, temperature and structured output schema are
+    sent as one ``abatch`` so providers with batch support amortize the
+    round-trip; distinct configurations run concurrently.
+    
     Args:
         calls: List of dicts with keys: 'model', 'prompt', 'temperature', 'structured_output'
     
     Returns:
         List of LLM responses in same order as input
     """
-    async def single_llm_call(call_config):
+    # {(model, temperature, id(schema)): (schema, [call indices])}
+    groups: Dict[tuple, tuple] = {}
+    for index, call_config in enumerate(calls):
         model_name = call_config.get('model', 'gemini-2.5-flash')
-        prompt = call_config['prompt']
         temperature = call_config.get('temperature', 0.2)
         structured_output = call_config.get('structured_output')
-        
+        key = (model_name, temperature, id(structured_output))
+        groups.setdefault(key, (structured_output, []))[1].append(index)
+    
+    async def group_llm_call(model_name, temperature, structured_output, indices):
         # Get cached LLM instance
         llm = _async_manager.get_cached_llm(model_name, temperature)
         
@@ -82,13 +173,22 @@ async def parallel_llm_calls(calls: List[Dict[str, Any]]) -> List[Any]:
         if structured_output:
             llm = llm.with_structured_output(structured_output)
         
-        # Execute in thread pool to avoid blocking
-        return await _async_manager.run_in_executor(llm.invoke, prompt)
+        prompts = [calls[index]['prompt'] for index in indices]
+        if len(prompts) == 1:
+            return [await llm.ainvoke(prompts[0])]
+        return await llm.abatch(prompts)
     
-    # Execute all calls in parallel
+    # Execute all groups in parallel
     async with async_performance_timer("parallel_llm_calls"):
-        results = await asyncio.gather(*[single_llm_call(call) for call in calls])
+        group_results = await asyncio.gather(*[
+            group_llm_call(model_name, temperature, structured_output, indices)
+            for (model_name, temperature, _), (structured_output, indices) in groups.items()
+        ])
     
+    results: List[Any] = [None] * len(calls)
+    for (_, indices), responses in zip(groups.values(), group_results):
+        for index, response in zip(indices, responses):
+            results[index] = response
     return results
 
 
@@ -115,6 +215,109 @@ async def parallel_tool_execution(tool_calls: List[Dict[str, Any]]) -> List[Any]
     return results
 
 
+class BatchingLLMClient:
+    """
+    Coalesce concurrent LLM prompts into batched provider calls.
+
+    Prompts submitted within a short window (or until the batch size cap is
+    reached) are dispatched together. Every provider call on a loop shares
+    one semaphore, so at most ``max_concurrency`` requests are in flight per
+    loop no matter how many batches overlap.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        temperature: float = 0.2,
+        window_seconds: float = 0.03,
+        max_batch_size: int = 8,
+        max_concurrency: int = 4,
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        # One queue/worker/semaphore per event loop - none of them can be shared across loops.
+        # The worker task keeps its loop alive, so entries are removed by the
+        # worker itself when it exits (loop shutdown cancels it)
+        self._workers: Dict[asyncio.AbstractEventLoop, tuple] = {}
+        # Strong references so in-flight dispatch tasks are not garbage collected
+        self._pending = set()
+
+    def _get_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        worker = self._workers.get(loop)
+        if worker is None:
+            queue = asyncio.Queue()
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            worker = (queue, loop.create_task(self._collect(queue, semaphore)), semaphore)
+            self._workers[loop] = worker
+        return worker[0]
+
+    async def submit(self, prompt: str) -> str:
+        """Queue a prompt and wait for its response text."""
+        future = asyncio.get_running_loop().create_future()
+        await self._get_queue().put((prompt, future))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue, semaphore: asyncio.Semaphore):
+        """Gather prompts into batches and dispatch them without blocking the next window."""
+        loop = asyncio.get_running_loop()
+        batch: List[tuple] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.window_seconds
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                task = loop.create_task(self._dispatch(batch, semaphore))
+                batch = []
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+        finally:
+            # Release the loop and cancel prompts that were never dispatched
+            if self._workers.get(loop, (None,))[0] is queue:
+                del self._workers[loop]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, future in batch:
+                future.cancel()
+
+    async def _dispatch(self, batch: List[tuple], semaphore: asyncio.Semaphore):
+        llm = _async_manager.get_cached_llm(self.model_name, self.temperature)
+
+        async def invoke(prompt: str):
+            async with semaphore:
+                return await llm.ainvoke(prompt)
+
+        try:
+            results = await asyncio.gather(
+                *(invoke(prompt) for prompt, _ in batch), return_exceptions=True
+            )
+        except BaseException:
+            # Cancelled (e.g. loop shutdown) - don't leave the callers waiting forever
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result.content)
+
+
 def sync_to_async(func):
     """Decorator to convert sync function to async."""
     @wraps(func)
@@ -151,6 +354,10 @@ class FastQueryDetector:
         'which is better'
     ]
     
+    # Compiled once at class creation - one scan per query instead of a loop per pattern
+    _COMPLEX_RE = re.compile("|".join(re.escape(p) for p in COMPLEX_PATTERNS))
+    _SIMPLE_RE = re.compile("|".join(re.escape(p) for p in SIMPLE_PATTERNS))
+    
     @classmethod
     def is_simple_query(cls, query: str) -> bool:
         """
@@ -165,14 +372,12 @@ class FastQueryDetector:
         query_lower = query.lower().strip()
         
         # Check for complex patterns first (override simple patterns)
-        for pattern in cls.COMPLEX_PATTERNS:
-            if pattern in query_lower:
-                return False
+        if cls._COMPLEX_RE.search(query_lower):
+            return False
         
-        # Check for simple patterns
-        for pattern in cls.SIMPLE_PATTERNS:
-            if query_lower.startswith(pattern):
-                return True
+        # Check for simple patterns (prefix match)
+        if cls._SIMPLE_RE.match(query_lower):
+            return True
         
         # If query is very short, likely simple
         if len(query.split()) <= 4:
@@ -205,28 +410,52 @@ def calculate_similarity(query1: str, query2: str) -> float:
 
 
 class QueryCache:
-    """Cache full query responses based on similarity."""
+    """
+    Cache full query responses based on similarity.
+    
+    Lookups and stores run in worker threads, so the dicts are only read
+    or changed under the lock; embeddings are computed outside it.
+    """
     
     def __init__(self, similarity_threshold: float = 0.95):
         self.cache = {}  # {query: (embedding, response, timestamp)}
+        self.exact = {}  # {normalized query hash: query} - O(1) tier checked first
         self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _exact_key(query: str) -> str:
+        """Hash of the normalized query for exact-repeat lookups."""
+        return hashlib.blake2b(query.strip().lower().encode(), digest_size=16).hexdigest()
         
     def get_similar_response(self, query: str) -> Optional[str]:
         """Get cached response for similar query."""
         if not self.cache:
             return None
+        
+        # Exact repeats skip embedding computation entirely
+        with self._lock:
+            exact_query = self.exact.get(self._exact_key(query))
+            exact_entry = self.cache.get(exact_query) if exact_query is not None else None
+        if exact_entry is not None:
+            performance_logger.debug("query_cache_hit", match="exact")
+            return exact_entry[1]
             
+        import numpy as np
+
         query_emb = get_query_embedding(query)
+        with self._lock:
+            entries = list(self.cache.values())
         
-        for cached_query, (cached_emb, response, timestamp) in self.cache.items():
+        for cached_emb, response, timestamp in entries:
             # Calculate similarity using numpy
-            import numpy as np
             similarity = np.dot(query_emb, cached_emb) / (
                 np.linalg.norm(query_emb) * np.linalg.norm(cached_emb)
             )
             
             if similarity >= self.similarity_threshold:
-                print(f"CACHE_HIT: Found similar query (similarity: {similarity:.3f})")
+                performance_logger.debug("query_cache_hit", match="similar",
+                                         similarity=round(float(similarity), 3))
                 return response
                 
         return None
@@ -234,39 +463,42 @@ class QueryCache:
     def cache_response(self, query: str, response: str):
         """Cache a query response."""
         embedding = get_query_embedding(query)
-        self.cache[query] = (embedding, response, time.time())
-        
-        # Limit cache size
-        if len(self.cache) > 100:
-            # Remove oldest entries
-            oldest_queries = sorted(
-                self.cache.keys(), 
-                key=lambda q: self.cache[q][2]
-            )[:20]
-            for old_query in oldest_queries:
-                del self.cache[old_query]
+        with self._lock:
+            self.cache[query] = (embedding, response, time.time())
+            self.exact[self._exact_key(query)] = query
+            
+            # Limit cache size
+            if len(self.cache) > 100:
+                # Remove oldest entries
+                oldest_queries = sorted(
+                    self.cache.keys(), 
+                    key=lambda q: self.cache[q][2]
+                )[:20]
+                for old_query in oldest_queries:
+                    del self.cache[old_query]
+                    # Keep the exact tier consistent with the similarity cache
+                    key = self._exact_key(old_query)
+                    if self.exact.get(key) == old_query:
+                        del self.exact[key]
 
 
 # Global query cache
 _query_cache = QueryCache()
 
 
-def should_use_fast_path(query: str, session_history: List = None) -> bool:
+def should_use_fast_path(query: str, session_history: List = None, check_cache: bool = True) -> bool:
     """
     Determine if query should use fast processing path.
     
     Args:
         query: User's question
         session_history: Previous conversation history
+        check_cache: Consult the query cache; pass False when the caller already missed it
         
     Returns:
         True if fast path should be used
     """
-    # Check for cached similar response
-    if _query_cache.get_similar_response(query):
-        return True
-    
-    # Check if query is simple
+    # Cheap heuristics first - the cache lookup may need an embedding
     if FastQueryDetector.is_simple_query(query):
         return True
         
@@ -276,4 +508,8 @@ def should_use_fast_path(query: str, session_history: List = None) -> bool:
         if FastQueryDetector.is_simple_query(last_query) and len(query.split()) <= 6:
             return True
     
-    return False
\ No newline at end of file
+    # Check for cached similar response
+    if check_cache and _query_cache.get_similar_response(query):
+        return True
+    
+    return False
@@ -13,9 +13,9 @@ CRITICAL FIXES:
 import argparse
 import os
 import sys
+import traceback
 from typing import List, Dict, Any
 from dotenv import load_dotenv
-from tools.web_search_tool import web_search_tool
 
 # Add the project root to Python path
 project_root = os.path.dirname(
@@ -24,8 +24,6 @@ project_root = os.path.dirname(
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-load_dotenv()
-
 # Import structured logging
 from backend.code.structured_logging import cli_logger, start_request_tracking
 from backend.code.agent_nodes.rag_retrieval_agent.config_loader import load_app_config
@@ -143,6 +141,12 @@ def main():
         help="Run in test mode (no API key required)"
     )
 
+    parser.add_argument(
+        "--render-graph",
+        action="store_true",
+        help="Render the workflow graph image to the outputs directory and exit"
+    )
+
     args = parser.parse_args()
     
     # CRITICAL FIX: Sanitize session ID if provided
@@ -158,10 +162,18 @@ def main():
                 "correlation_id": correlation_id
             })
     
+    render_graph = getattr(args, "render_graph", False)
+
     # Check if question is required
-    if not args.list_sessions and not args.test and not args.question:
+    if not args.list_sessions and not args.test and not render_graph and not args.question:
         parser.error("the following arguments are required: -q/--question")
 
+    # Handle graph rendering
+    if render_graph:
+        from backend.code.graph_workflow import get_compiled_graph, visualize_graph
+        visualize_graph(get_compiled_graph(), force=True)
+        return
+
     # Handle session listing
     if args.list_sessions:
         try:
@@ -242,6 +254,9 @@ def main():
         })
         return
 
+    # Environment is only needed past the session-listing and test-mode exits
+    load_dotenv()
+
     # Load config to get the model name and validate the appropriate API key
     try:
         app_config = load_app_config()
@@ -288,6 +303,10 @@ def main():
             from backend.code.fast_workflow import run_optimized_workflow
             results = run_optimized_workflow(text=args.question, session_id=session_id)
             
+            if not results.get("fast_path") and "error" not in results:
+                from backend.code.graph_workflow import format_workflow_summary
+                print(format_workflow_summary(results))
+            
             # Display the synthesis response
             if "synthesis" in results:
                 cli_logger.info("Synthesis response generated", extra={
@@ -374,7 +393,6 @@ def main():
             "correlation_id": correlation_id
         })
         
-        import traceback
         cli_logger.error("Full traceback", extra={
             "event": "cli_traceback",
             "traceback": traceback.format_exc(),
@@ -2,29 +2,82 @@
 Fast workflow for simple queries - bypasses multi-agent processing for 90% performance improvement.
 """
 import asyncio
-from typing import Dict, Any, Optional
+import threading
+import weakref
+from typing import Dict, Any, AsyncIterator, List, Optional, Coroutine
+
+import orjson
 
 from backend.code.async_utils import (
     should_use_fast_path, 
     _query_cache, 
     _async_manager,
-    async_performance_timer
+    async_performance_timer,
+    BatchingLLMClient,
+    QueryCache,
 )
 from backend.code.utils import load_yaml_config, performance_timer, _chroma_manager
 from backend.code.paths import APP_CONFIG_FPATH
 from backend.code.session_manager import session_manager
-from backend.code.agent_nodes.rag_retrieval_agent.chat_logic import chat
+from backend.code.structured_logging import workflow_logger
+from backend.code.agent_nodes.rag_retrieval_agent.chat_logic import achat, build_chat_prompt
+
+
+# Concurrent fast-path requests share batched LLM calls
+_llm_batcher = BatchingLLMClient(
+    model_name=load_yaml_config(APP_CONFIG_FPATH).get("llm", "gemini-2.5-flash")
+)
+
+# In-flight fast-path answers per event loop, keyed like the query cache's exact tier
+_inflight_answers = weakref.WeakKeyDictionary()
 
 
-async def fast_path_query(query: str, session_id: str) -> Dict[str, Any]:
+async def _answer_and_cache(query: str, session_id: str) -> str:
+    rag_response = await achat(session_id, query, submit=_llm_batcher.submit)
+    # Caching embeds the query on the CPU - keep it off the event loop
+    await _async_manager.run_in_executor(_query_cache.cache_response, query, rag_response)
+    return rag_response
+
+
+async def _single_flight_answer(query: str, session_id: str) -> str:
+    """
+    Answer a query once for all concurrent identical requests.
+    
+    Repeats that arrive while the first request is still waiting on the LLM
+    await the same task instead of issuing their own call. This closes the
+    gap before the answer reaches the query cache. The task is shielded so
+    one client disconnecting does not cancel the answer for the others.
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _inflight_answers.setdefault(loop, {})
+    key = QueryCache._exact_key(query)
+    task = inflight.get(key)
+    if task is None:
+        task = loop.create_task(_answer_and_cache(query, session_id))
+        inflight[key] = task
+        task.add_done_callback(
+            lambda done: inflight.pop(key) if inflight.get(key) is done else None
+        )
+    else:
+        workflow_logger.debug("fast_path_coalesced", session_id=session_id)
+    return await asyncio.shield(task)
+
+
+async def fast_path_query(query: str, session_id: str, check_cache: bool = True) -> Dict[str, Any]:
     """
     Fast path for simple queries - bypasses full agent workflow.
     
     Expected performance: 3-5 seconds vs 24+ seconds for full workflow.
+    Pass check_cache=False when the caller has already missed the query cache.
     """
     async with async_performance_timer("fast_path_total"):
         # Check query cache first
-        cached_response = _query_cache.get_similar_response(query)
+        # The cache lookup may embed the query on the CPU - keep it off the event loop
+        cached_response = None
+        if check_cache:
+            cached_response = await _async_manager.run_in_executor(
+                _query_cache.get_similar_response, query
+            )
         if cached_response:
             return {
                 "synthesis": cached_response,
@@ -34,15 +87,14 @@ async def fast_path_query(query: str, session_id: str) -> Dict[str, Any]:
                 "processing_time": "< 0.1s"
             }
         
+        await _await_warmup()
+        
         # Use direct RAG without multi-agent overhead
         with performance_timer("fast_rag_processing"):
-            # Execute RAG in thread pool to avoid blocking
-            rag_response = await _async_manager.run_in_executor(
-                chat, session_id, query
-            )
-        
-        # Cache the response for future similar queries
-        _query_cache.cache_response(query, rag_response)
+            # Native async chat; the LLM call goes through the batcher so
+            # concurrent requests share round-trips, and identical concurrent
+            # queries share one call. The answer is cached for similar queries.
+            rag_response = await _single_flight_answer(query, session_id)
         
         return {
             "synthesis": rag_response,
@@ -53,81 +105,178 @@ async def fast_path_query(query: str, session_id: str) -> Dict[str, Any]:
         }
 
 
-def run_optimized_workflow(text: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+async def fast_path_stream(query: str, session_id: str) -> AsyncIterator[str]:
     """
-    Optimized workflow dispatcher - chooses fast path vs full workflow.
+    Streaming variant of fast_path_query - yields answer tokens as they are decoded.
+    
+    The full answer is saved to chat memory and the query cache once the
+    stream finishes. Callers are expected to have checked the query cache
+    already.
+    """
+    async with async_performance_timer("fast_path_stream_total"):
+        await _await_warmup()
+        prompt, memory = await _async_manager.run_in_executor(
+            build_chat_prompt, session_id, query
+        )
+        llm = _async_manager.get_cached_llm(_llm_batcher.model_name, _llm_batcher.temperature)
+        
+        parts: List[str] = []
+        async for chunk in llm.astream(prompt):
+            delta = chunk.content if isinstance(chunk.content, str) else ""
+            if not delta:
+                continue
+            parts.append(delta)
+            yield delta
+        
+        rag_response = "".join(parts)
+        await _async_manager.run_in_executor(
+            memory.save_context, {"question": query}, {"answer": rag_response}
+        )
+        await _async_manager.run_in_executor(_query_cache.cache_response, query, rag_response)
+
+
+# Persistent event loop for sync callers (CLI, sync endpoints)
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop shared by all sync callers."""
+    global _BG_LOOP
+    if _BG_LOOP is None:
+        with _BG_LOOP_LOCK:
+            if _BG_LOOP is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="fast-workflow-loop", daemon=True
+                )
+                thread.start()
+                # Sync callers' LLM calls run on this loop; build its pooled model up front
+                loop.call_soon_threadsafe(warm_llm_for_running_loop)
+                _BG_LOOP = loop
+    return _BG_LOOP
+
+
+def warm_llm_for_running_loop() -> None:
+    """
+    Build the fast-path model for the running loop before its first request.
+    
+    Pooled providers (OpenAI, Groq) get one model and async HTTP client per
+    event loop, so each serving loop warms its own; the configured Gemini
+    model is not pooled and is shared with the import-time warm-up.
+    """
+    try:
+        _async_manager.get_cached_llm(_llm_batcher.model_name, _llm_batcher.temperature)
+    except Exception as e:
+        workflow_logger.warning("loop_llm_prewarm_failed",
+                                error_type=type(e).__name__, error_message=str(e))
+
+
+def run_coroutine_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Schedules onto the persistent background loop instead of building and
+    tearing down a new event loop per call, which also keeps it safe to call
+    from threads that already have a running loop (e.g. under uvicorn).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def load_session_history(session_id: Optional[str]) -> List[Dict[str, str]]:
+    """Load the recent questions used for the fast-path decision."""
+    if not session_id:
+        return []
+    try:
+        history = session_manager.load_conversation_history(session_id, limit=5)
+        return [{"question": turn.question} for turn in history]
+    except Exception:
+        return []  # Continue without history if loading fails
+
+
+def choose_fast_path(text: str, session_id: Optional[str], check_cache: bool = True) -> bool:
+    """
+    Decide between the fast path and the full workflow.
+    
+    Reads session history from SQLite and may embed the query for the cache
+    check, so async callers should run it in the executor.
+    """
+    return should_use_fast_path(text, load_session_history(session_id), check_cache=check_cache)
+
+
+async def run_optimized_workflow_async(
+    text: str,
+    session_id: Optional[str] = None,
+    force_fast_path: Optional[bool] = None,
+    check_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Async optimized workflow dispatcher - chooses fast path vs full workflow.
+    
+    Use this directly from async callers (FastAPI endpoints) so the fast path
+    is awaited on the caller's loop without nesting event loops.
     
     Args:
         text: User's question
         session_id: Optional session ID
+        force_fast_path: Path decision already made by the caller; None to decide here
+        check_cache: Set False when the caller already missed the query cache
         
     Returns:
         Response dictionary with synthesis and metadata
     """
-    # Get session history for context
-    session_history = []
-    if session_id:
-        try:
-            history = session_manager.load_conversation_history(session_id, limit=5)
-            session_history = [{"question": turn.question} for turn in history]
-        except Exception:
-            pass  # Continue without history if loading fails
-    
     # Decide on processing path
-    use_fast_path = should_use_fast_path(text, session_history)
+    use_fast_path = force_fast_path
+    if use_fast_path is None:
+        use_fast_path = await _async_manager.run_in_executor(
+            choose_fast_path, text, session_id, check_cache
+        )
     
     if use_fast_path:
-        print("🚀 FAST_PATH: Using optimized processing for simple query")
+        workflow_logger.debug("processing_path_selected", path="fast", session_id=session_id)
         
-        # Run async fast path
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(fast_path_query(text, session_id))
-            loop.close()
-            return result
+            return await fast_path_query(text, session_id, check_cache=check_cache)
         except Exception as e:
-            print(f"⚠️ FAST_PATH failed, falling back to full workflow: {e}")
+            workflow_logger.warning("fast_path_failed_falling_back", session_id=session_id,
+                                    error_type=type(e).__name__, error_message=str(e))
             # Fall through to full workflow
     
     # Use full multi-agent workflow for complex queries
-    print("🔄 FULL_WORKFLOW: Using complete agent processing")
-    from backend.code.graph_workflow import run_agentic_askimmigrate
-    return run_agentic_askimmigrate(text=text, session_id=session_id)
+    workflow_logger.debug("processing_path_selected", path="full", session_id=session_id)
+    from backend.code.graph_workflow import arun_agentic_askimmigrate
+    return await arun_agentic_askimmigrate(text, session_id)
 
 
-class StreamingResponseManager:
-    """Manages streaming responses for immediate user feedback."""
+def run_optimized_workflow(
+    text: str,
+    session_id: Optional[str] = None,
+    force_fast_path: Optional[bool] = None,
+    check_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Optimized workflow dispatcher - chooses fast path vs full workflow.
     
-    def __init__(self):
-        self.callbacks = []
-        
-    def add_callback(self, callback):
-        """Add callback for streaming updates."""
-        self.callbacks.append(callback)
-        
-    def stream_update(self, message: str, stage: str):
-        """Send streaming update to all callbacks."""
-        for callback in self.callbacks:
-            try:
-                callback({
-                    "message": message,
-                    "stage": stage,
-                    "timestamp": __import__('time').time()
-                })
-            except Exception:
-                pass  # Don't let callback errors break the flow
+    Sync wrapper around run_optimized_workflow_async for the CLI and other
+    non-async callers.
     
-    def stream_partial_response(self, partial_text: str, completion_percent: int):
-        """Stream partial response as it's being generated."""
-        self.stream_update(
-            message=partial_text,
-            stage=f"generating_response_{completion_percent}%"
-        )
+    Args:
+        text: User's question
+        session_id: Optional session ID
+        force_fast_path: Path decision already made by the caller; None to decide here
+        check_cache: Set False when the caller already missed the query cache
+        
+    Returns:
+        Response dictionary with synthesis and metadata
+    """
+    return run_coroutine_sync(
+        run_optimized_workflow_async(text, session_id, force_fast_path, check_cache)
+    )
 
 
-# Global streaming manager
-streaming_manager = StreamingResponseManager()
+def _sse(event: Dict[str, Any]) -> bytes:
+    """Encode one server-sent event; orjson emits bytes StreamingResponse can send as-is."""
+    return b"data: " + orjson.dumps(event, default=str) + b"\n\n"
 
 
 def create_fast_api_endpoint():
@@ -137,37 +286,62 @@ def create_fast_api_endpoint():
     """
     from fastapi import FastAPI
     from fastapi.responses import StreamingResponse
-    import json
     
-    def get_optimized_response(query: str, session_id: str = None):
-        """Generator for streaming response."""
+    async def get_optimized_response(query: str, session_id: str = None):
+        """Async generator for streaming response; fast-path answers stream token by token."""
         # Send immediate acknowledgment
-        yield f"data: {json.dumps({'stage': 'processing_started', 'message': 'Processing your question...'})}\n\n"
+        yield _sse({'stage': 'processing_started', 'message': 'Processing your question...'})
         
         # Check for cached response first
-        cached = _query_cache.get_similar_response(query)
+        cached = await _async_manager.run_in_executor(_query_cache.get_similar_response, query)
         if cached:
-            yield f"data: {json.dumps({'stage': 'cache_hit', 'message': 'Found similar previous answer'})}\n\n"
-            yield f"data: {json.dumps({'stage': 'complete', 'response': cached, 'processing_time': '<0.1s'})}\n\n"
+            yield _sse({'stage': 'cache_hit', 'message': 'Found similar previous answer'})
+            yield _sse({'stage': 'complete', 'response': cached, 'processing_time': '<0.1s'})
             return
         
-        # Determine processing path
-        use_fast = should_use_fast_path(query)
+        # Determine processing path once (cache already missed above) and pass it through
+        use_fast = await _async_manager.run_in_executor(choose_fast_path, query, session_id, False)
         processing_type = "fast_path" if use_fast else "full_workflow"
         estimated_time = "3-5 seconds" if use_fast else "15-25 seconds"
         
-        yield f"data: {json.dumps({'stage': 'path_selected', 'message': f'Using {processing_type} (est. {estimated_time})'})}\n\n"
+        yield _sse({'stage': 'path_selected', 'message': f'Using {processing_type} (est. {estimated_time})'})
         
-        # Execute processing
-        result = run_optimized_workflow(query, session_id)
+        if use_fast:
+            parts = []
+            try:
+                async for delta in fast_path_stream(query, session_id):
+                    parts.append(delta)
+                    yield _sse({'stage': 'token', 'delta': delta})
+                result = {
+                    "synthesis": "".join(parts),
+                    "session_id": session_id,
+                    "fast_path": True,
+                    "cache_hit": False,
+                }
+                yield _sse({'stage': 'complete', 'response': result['synthesis'], 'metadata': result})
+                return
+            except Exception as e:
+                if parts:
+                    raise
+                workflow_logger.warning("fast_path_stream_failed_falling_back", session_id=session_id,
+                                        error_type=type(e).__name__, error_message=str(e))
         
-        # Stream final response
-        yield f"data: {json.dumps({'stage': 'complete', 'response': result['synthesis'], 'metadata': result})}\n\n"
+        # Execute full workflow, forwarding synthesis tokens as they are generated
+        from backend.code.graph_workflow import stream_agentic_askimmigrate
+        async for kind, payload in stream_agentic_askimmigrate(query, session_id):
+            if kind == "token":
+                yield _sse({'stage': 'token', 'delta': payload})
+            else:
+                # The final synthesis supersedes streamed drafts (reviewer revisions)
+                yield _sse({'stage': 'complete', 'response': payload['synthesis'], 'metadata': payload})
     
     return get_optimized_response
 
 
-# Pre-warm critical components at module import
+# Pre-warm critical components in the background at module import
+_warmup_done = threading.Event()
+
+
 def _initialize_performance_components():
     """Initialize performance-critical components."""
     try:
@@ -178,16 +352,29 @@ def _initialize_performance_components():
         # Pre-warm ChromaDB connection
         _chroma_manager.get_collection("publications")
         
-        # Pre-warm LLM cache with common model
+        # Pre-warm LLM cache with common model (loop-independent instance;
+        # serving loops warm their own via warm_llm_for_running_loop)
         config = load_yaml_config(APP_CONFIG_FPATH)
         model_name = config.get("llm", "gemini-2.5-flash")
         _async_manager.get_cached_llm(model_name)
         
-        print("✅ Performance components pre-warmed successfully")
+        workflow_logger.info("performance_components_prewarmed")
         
     except Exception as e:
-        print(f"⚠️ Warning: Could not pre-warm all components: {e}")
+        workflow_logger.warning("performance_components_prewarm_failed",
+                                error_type=type(e).__name__, error_message=str(e))
+    finally:
+        # Consumers only wait for the attempt, not for success
+        _warmup_done.set()
+
+
+async def _await_warmup():
+    """Wait for the background warm-up without blocking the event loop."""
+    if not _warmup_done.is_set():
+        await _async_manager.run_in_executor(_warmup_done.wait)
 
 
-# Initialize on import
-_initialize_performance_components()
\ No newline at end of file
+# Initialize on import without blocking the importer
+threading.Thread(
+    target=_initialize_performance_components, name="fast-workflow-warmup", daemon=True
+).start()
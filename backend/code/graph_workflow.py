@@ -1,63 +1,158 @@
-from typing import Dict, Any, Optional, List
-from langgraph.constants import START, END
+import asyncio
+import threading
+import time
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
+from langgraph.constants import START
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
-from backend.code.agent_nodes.manager_node import manager_node
-from backend.code.agent_nodes.synthesis_node import synthesis_node
-from backend.code.agent_nodes.reviewer_node import reviewer_node, route_from_reviewer
 from backend.code.agentic_state import ImmigrationState, ConversationTurn, SessionContext
 from backend.code.session_manager import session_manager
 from backend.code.structured_logging import workflow_logger, PerformanceTimer, start_request_tracking
-from langchain_core.runnables.graph import MermaidDrawMethod
+from langchain_core.runnables import RunnableLambda
 import os
-from dotenv import load_dotenv
-from backend.code.paths import OUTPUTS_DIR
+import shutil
+from backend.code.paths import OUTPUTS_DIR, WORKFLOW_GRAPH_PNG_FPATH
 from datetime import datetime
 
-load_dotenv()
-if os.environ.get("LANGSMITH_TRACING") == "true":
-    workflow_logger.info("langsmith_tracing_enabled", 
-                        details="LangSmith tracing is enabled. Runs will be tracked in LangSmith dashboard.")
-else:
-    workflow_logger.info("langsmith_tracing_disabled", 
-                        details="LangSmith tracing is disabled. To enable, set LANGSMITH_TRACING=true in your environment.")
+_tracing_status_logged = False
+
+
+def _log_tracing_status_once() -> None:
+    """Report LangSmith tracing status on the first workflow run only."""
+    global _tracing_status_logged
+    if _tracing_status_logged:
+        return
+    _tracing_status_logged = True
+    if os.environ.get("LANGSMITH_TRACING") == "true":
+        workflow_logger.info("langsmith_tracing_enabled", 
+                            details="LangSmith tracing is enabled. Runs will be tracked in LangSmith dashboard.")
+    else:
+        workflow_logger.warning("langsmith_tracing_disabled", 
+                            details="LangSmith tracing is disabled. To enable, set LANGSMITH_TRACING=true in your environment.")
 
 def create_ask_immigrate_graph() -> CompiledStateGraph:
     """
     Creates the enhanced AskImmigrate2.0 graph with strategic manager coordination.
     """
+    # Agent nodes pull in the LLM SDKs and tool stacks; import them only when
+    # a graph is actually built so list_sessions and other light callers
+    # don't pay for them
+    from backend.code.agent_nodes.manager_node import manager_node
+    from backend.code.agent_nodes.fast_answer_node import (
+        fast_answer_node,
+        afast_answer_node,
+        route_from_start,
+        route_from_fast_answer,
+    )
+    from backend.code.agent_nodes.synthesis_node import synthesis_node
+    from backend.code.agent_nodes.reviewer_node import reviewer_node, areviewer_node, route_from_reviewer
+    from backend.code.agent_nodes.tool_fanout_node import dispatch_recommended_tools, tool_worker_node
+    
     workflow_logger.info("graph_building_started")
     
     graph = StateGraph(ImmigrationState)
 
     # Add agent nodes
+    # Nodes with a native async variant await their LLM call under ainvoke /
+    # astream_events; the others run in LangGraph's worker threads there
+    graph.add_node("fast_answer", RunnableLambda(fast_answer_node, afunc=afast_answer_node))
     graph.add_node("manager", manager_node)
+    graph.add_node("tool_worker", tool_worker_node)
     graph.add_node("synthesizer", synthesis_node)
-    graph.add_node("reviewer", reviewer_node)
+    graph.add_node("reviewer", RunnableLambda(reviewer_node, afunc=areviewer_node))
 
     # Build the workflow edges
     workflow_logger.info("workflow_edges_connecting")
     
-    graph.add_edge(START, "manager")
-    graph.add_edge("manager", "synthesizer")
+    # Simple standalone questions get analysis + answer from one LLM call
+    graph.add_conditional_edges(START, route_from_start, ["fast_answer", "manager"])
+    graph.add_conditional_edges("fast_answer", route_from_fast_answer)
+    # Recommended tools fan out in parallel (Send) and re-converge at synthesis
+    graph.add_conditional_edges("manager", dispatch_recommended_tools, ["tool_worker", "synthesizer"])
+    graph.add_edge("tool_worker", "synthesizer")
     graph.add_edge("synthesizer", "reviewer")
     
-    graph.add_conditional_edges(
-        "reviewer",
-        route_from_reviewer,
-        {
-            "synthesis": "synthesizer",
-            "end": END,
-        },
-    )
+    graph.add_conditional_edges("reviewer", route_from_reviewer)
 
     workflow_logger.info("graph_structure_completed")
     return graph.compile()
 
-def create_initial_state(text: str, session_id: Optional[str] = None) -> ImmigrationState:
+# The topology is static, so compile once and share the instance across requests
+_COMPILED_GRAPH: Optional[CompiledStateGraph] = None
+_COMPILED_GRAPH_LOCK = threading.Lock()
+
+
+def get_compiled_graph() -> CompiledStateGraph:
+    """Return the shared compiled workflow graph, building it on first use."""
+    global _COMPILED_GRAPH
+    if _COMPILED_GRAPH is None:
+        with _COMPILED_GRAPH_LOCK:
+            if _COMPILED_GRAPH is None:
+                with PerformanceTimer(workflow_logger, "graph_creation"):
+                    _COMPILED_GRAPH = create_ask_immigrate_graph()
+    return _COMPILED_GRAPH
+
+
+# Static defaults for every new workflow state, built once at import and
+# read-only so no request can leak a mutation into the next one
+_INITIAL_STATE_TEMPLATE = MappingProxyType(ImmigrationState(
+    session_context=None,
+    is_followup_question=False,
+    conversation_turn_number=1,
+    manager_decision=None,
+    structured_analysis=None,
+    workflow_parameters=None,
+    synthesis="",
+    rag_response="",
+    revision_round=0,
+    needs_revision=None,
+    synthesis_approved=None,
+    rag_retriever_approved=None,
+    references_approved=None,
+    synthesis_feedback=None,
+    rag_retriever_feedback=None,
+    references_feedback=None,
+    visa_type="",
+    visa_fee=0.0,
+    strategy_applied=None,
+    synthesis_metadata=None
+))
+
+
+# Nodes only read session_context, so every new/failed session can share one
+# empty instance (flyweight) instead of allocating its own per request
+_EMPTY_SESSION_CONTEXT = SessionContext()
+
+
+def _timestamped_session_id(prefix: str) -> str:
+    """Session ID for fallback paths: millisecond epoch in hex, no datetime formatting."""
+    return f"{prefix}-{int(time.time() * 1000):x}"
+
+
+def _fallback_state(text: str, session_id: str) -> ImmigrationState:
+    """Minimal valid state used when normal initial-state creation fails."""
+    return ImmigrationState(
+        _INITIAL_STATE_TEMPLATE,
+        text=text,
+        user_question=text,
+        session_id=session_id,
+        conversation_history=[],
+        session_context=_EMPTY_SESSION_CONTEXT,
+        tool_results={},
+        tools_used=[],
+        references=[],
+    )
+
+
+def create_initial_state(text: str, session_id: Optional[str] = None,
+                         now_iso: Optional[str] = None) -> ImmigrationState:
     """
     Create enhanced initial state with COMPLETE session support and debugging.
     
+    now_iso is the request's timestamp; it is stored as analysis_timestamp and
+    later reused as the saved turn's timestamp.
+    
     CRITICAL FIXES:
     - Complete implementation with all session loading logic
     - Session ID sanitization to handle whitespace issues
@@ -74,17 +169,18 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
     )
     
     # CRITICAL FIX: Sanitize session ID to remove whitespace
-    actual_session_id = session_id
-    if actual_session_id:
-        actual_session_id = actual_session_id.strip()
-        if actual_session_id != session_id:
-            workflow_logger.info(
-                "session_id_sanitized",
-                original_session_id=session_id,
-                sanitized_session_id=actual_session_id
-            )
+    actual_session_id = session_id.strip() if session_id else session_id
+    # str.strip returns the same object when there was nothing to strip
+    if actual_session_id is not session_id:
+        workflow_logger.debug(
+            "session_id_sanitized",
+            original_session_id=session_id,
+            sanitized_session_id=actual_session_id
+        )
     
-    if actual_session_id is None or actual_session_id == "":
+    # An auto-generated ID is fresh (random suffix), so it has no stored history
+    session_was_provided = bool(actual_session_id)
+    if not session_was_provided:
         from backend.code.utils import slugify_chat_session
         actual_session_id = slugify_chat_session(text)
         workflow_logger.info("session_id_auto_created", session_id=actual_session_id)
@@ -92,35 +188,17 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
         workflow_logger.info("session_id_provided", session_id=actual_session_id)
     
     # Initialize base state - GUARANTEED to be created
+    # Mutable containers are fresh per call; everything else comes from the template
     state = ImmigrationState(
+        _INITIAL_STATE_TEMPLATE,
         text=text,
         user_question=text,
         session_id=actual_session_id,
         conversation_history=[],
-        session_context=None,
-        is_followup_question=False,
-        conversation_turn_number=1,
-        manager_decision=None,
-        structured_analysis=None,
-        workflow_parameters=None,
-        synthesis="",
-        rag_response="",
         tool_results={},
         tools_used=[],
-        revision_round=0,
-        needs_revision=None,
-        synthesis_approved=None,
-        rag_retriever_approved=None,
-        references_approved=None,
-        synthesis_feedback=None,
-        rag_retriever_feedback=None,
-        references_feedback=None,
-        visa_type="",
-        visa_fee=0.0,
         references=[],
-        analysis_timestamp=datetime.now().isoformat(),
-        strategy_applied=None,
-        synthesis_metadata=None
+        analysis_timestamp=now_iso or datetime.now().isoformat(),
     )
     
     workflow_logger.info(
@@ -129,27 +207,31 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
         text_length=len(text)
     )
     
+    # New sessions skip the DB round-trips; save_conversation_turn creates the row later
+    if not session_was_provided:
+        workflow_logger.info(
+            "new_session_detected",
+            session_id=actual_session_id,
+            details="Session ID auto-created - skipping history lookup"
+        )
+        state["session_context"] = _EMPTY_SESSION_CONTEXT
+        state["conversation_history"] = []
+        state["conversation_turn_number"] = 1
+        return state
+    
     # CRITICAL FIX: Enhanced session context loading with proper debugging
     try:
         workflow_logger.info("session_context_loading_started", session_id=actual_session_id)
         
+        # Session row and history come back from one DB round-trip
         with PerformanceTimer(workflow_logger, "session_context_loading", session_id=actual_session_id):
-            # Get or create session with enhanced debugging
-            session_info = session_manager.get_or_create_session(actual_session_id)
-        
-        workflow_logger.info(
-            "session_info_retrieved",
-            session_id=actual_session_id,
-            turn_count=session_info['turn_count']
-        )
-        
-        # Load conversation history with enhanced debugging
-        with PerformanceTimer(workflow_logger, "conversation_history_loading", session_id=actual_session_id):
-            conversation_history = session_manager.load_conversation_history(actual_session_id)
+            snapshot = session_manager.get_session_snapshot(actual_session_id)
+        session_info, conversation_history = snapshot
         
         workflow_logger.info(
             "conversation_history_loaded",
             session_id=actual_session_id,
+            turn_count=session_info['turn_count'],
             history_length=len(conversation_history)
         )
         
@@ -170,12 +252,12 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
             ongoing_topics = session_context_data.get("ongoing_topics", [])
             visa_types_mentioned = session_context_data.get("visa_types_mentioned", [])
             
-            # Build session context object
-            state["session_context"] = SessionContext(
+            # Build session context object; the summary text is only rendered if a node reads it
+            state["session_context"] = SessionContext.with_lazy_summary(
+                snapshot.build_context_string,
                 ongoing_topics=ongoing_topics,
                 visa_types_mentioned=visa_types_mentioned,
                 user_situation=session_context_data.get("user_situation"),
-                previous_questions_summary=session_manager.build_session_context_string(actual_session_id)
             )
             
             # CRITICAL FIX: Enhanced follow-up question detection
@@ -192,15 +274,12 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
                 visa_types_count=len(visa_types_mentioned)
             )
             
-            # DEBUG: Log conversation history details
-            for i, turn in enumerate(conversation_history):
-                workflow_logger.debug(
-                    "conversation_turn_debug",
-                    session_id=actual_session_id,
-                    turn_number=i+1,
-                    question_preview=turn.question[:30],
-                    answer_preview=turn.answer[:50]
-                )
+            # One record per request; per-turn previews are already logged by the session manager
+            workflow_logger.debug(
+                "conversation_history_debug",
+                session_id=actual_session_id,
+                history_turn_count=len(conversation_history)
+            )
                 
         else:
             workflow_logger.info(
@@ -208,7 +287,7 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
                 session_id=actual_session_id,
                 details="No conversation history found - treating as new session"
             )
-            state["session_context"] = SessionContext()
+            state["session_context"] = _EMPTY_SESSION_CONTEXT
             state["is_followup_question"] = False
             
     except Exception as e:
@@ -220,7 +299,7 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
         )
         
         # Set safe defaults but don't fail - GUARANTEE state is valid
-        state["session_context"] = SessionContext()
+        state["session_context"] = _EMPTY_SESSION_CONTEXT
         state["is_followup_question"] = False
         state["conversation_history"] = []
         state["conversation_turn_number"] = 1
@@ -233,22 +312,6 @@ def create_initial_state(text: str, session_id: Optional[str] = None) -> Immigra
         history_length=len(state.get('conversation_history', []))
     )
     
-    # CRITICAL: Guarantee we return a valid state object
-    if state is None:
-        workflow_logger.error(
-            "initial_state_creation_critical_failure",
-            session_id=actual_session_id,
-            details="State is None, creating emergency fallback"
-        )
-        state = ImmigrationState(
-            text=text,
-            session_id=actual_session_id or "emergency-fallback",
-            conversation_history=[],
-            session_context=SessionContext(),
-            is_followup_question=False,
-            conversation_turn_number=1
-        )
-    
     return state
 
 def save_conversation_result(final_state: ImmigrationState) -> None:
@@ -261,46 +324,47 @@ def save_conversation_result(final_state: ImmigrationState) -> None:
         workflow_logger.error("conversation_save_failed", reason="No session ID found in final state")
         return
     
+    # IMPROVED: Better data validation - bail out before doing any other work
     user_question = final_state.get("text", "")
-    synthesis_response = final_state.get("synthesis", "")
-    
-    workflow_logger.info(
-        "conversation_save_attempt",
-        session_id=session_id,
-        question_preview=user_question[:50] if user_question else "",
-        response_length=len(synthesis_response)
-    )
-    
-    # IMPROVED: Better data validation
     if not user_question:
         workflow_logger.error("conversation_save_failed", 
                             session_id=session_id, 
                             reason="No user question found")
         return
-        
-    if not synthesis_response or len(synthesis_response.strip()) < 10:
+    
+    synthesis_response = final_state.get("synthesis") or ""
+    if len(synthesis_response.strip()) < 10:
         workflow_logger.error("conversation_save_failed", 
                             session_id=session_id,
                             reason="Response too short or empty",
                             response_preview=synthesis_response[:50])
         return
     
+    workflow_logger.info(
+        "conversation_save_attempt",
+        session_id=session_id,
+        question_preview=user_question[:50],
+        response_length=len(synthesis_response)
+    )
+    
     try:
         with PerformanceTimer(workflow_logger, "conversation_save", session_id=session_id):
             # IMPROVED: More robust conversation turn creation
+            structured_analysis = final_state.get("structured_analysis") or {}
             turn = ConversationTurn(
                 question=user_question,
                 answer=synthesis_response,
-                timestamp=datetime.now().isoformat(),
-                question_type=final_state.get("structured_analysis", {}).get("question_type"),
-                visa_focus=final_state.get("structured_analysis", {}).get("visa_focus"),
+                # Stamped once at request start; fallback states don't carry it
+                timestamp=final_state.get("analysis_timestamp") or datetime.now().isoformat(),
+                question_type=structured_analysis.get("question_type"),
+                visa_focus=structured_analysis.get("visa_focus"),
                 tools_used=final_state.get("tools_used", [])
             )
             
-            # Save to session with enhanced error handling
-            session_manager.save_conversation_turn(session_id, turn, final_state)
+            # Written by the session manager's background thread; the response doesn't wait on the DB
+            session_manager.enqueue_conversation_turn(session_id, turn, final_state)
         
-        workflow_logger.info("conversation_save_successful", session_id=session_id)
+        workflow_logger.info("conversation_save_queued", session_id=session_id)
         
     except Exception as e:
         workflow_logger.error(
@@ -312,19 +376,37 @@ def save_conversation_result(final_state: ImmigrationState) -> None:
             response_length=len(synthesis_response)
         )
 
-def visualize_graph(graph: StateGraph, save_path: str = OUTPUTS_DIR):
+def visualize_graph(graph: StateGraph, save_path: str = OUTPUTS_DIR, force: bool = False):
     """
     Visualize the enhanced workflow graph and save it.
+    
+    The topology is static, so an existing image is kept unless force=True.
+    Otherwise the image pre-rendered at build time is copied in; only
+    force=True or a missing asset falls back to the Mermaid API round-trip.
     """
+    graph_path = os.path.join(save_path, "enhanced_immigration_workflow.png")
+    if not force and os.path.exists(graph_path):
+        workflow_logger.debug("graph_visualization_skipped", graph_path=graph_path)
+        return
+    
+    if not force and os.path.exists(WORKFLOW_GRAPH_PNG_FPATH):
+        try:
+            shutil.copyfile(WORKFLOW_GRAPH_PNG_FPATH, graph_path)
+            workflow_logger.info("graph_visualization_copied", graph_path=graph_path)
+            return
+        except OSError as e:
+            workflow_logger.warning("graph_visualization_copy_failed", error_message=str(e))
+    
     workflow_logger.info("graph_visualization_started")
     
     try:
         mermaid_text = graph.get_graph().draw_mermaid()
         workflow_logger.debug("workflow_structure_generated", mermaid_preview=mermaid_text[:200])
         
+        from langchain_core.runnables.graph import MermaidDrawMethod
+        
         with PerformanceTimer(workflow_logger, "graph_visualization"):
             png = graph.get_graph().draw_mermaid_png(draw_method=MermaidDrawMethod.API)
-            graph_path = os.path.join(save_path, "enhanced_immigration_workflow.png")
             
             with open(graph_path, "wb") as f:
                 f.write(png)
@@ -339,18 +421,13 @@ def visualize_graph(graph: StateGraph, save_path: str = OUTPUTS_DIR):
             details="Graph structure is still functional, just visualization failed"
         )
 
-def run_agentic_askimmigrate(text: str, session_id: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Enhanced function to run the strategic immigration workflow with COMPLETE session support.
+def _begin_workflow_request(text: str, session_id: Optional[str]) -> str:
+    """Per-request setup shared by the sync and async entry points; returns the correlation ID."""
+    from backend.code.llm import ensure_env_loaded
+    
+    ensure_env_loaded()
+    _log_tracing_status_once()
     
-    CRITICAL FIXES:
-    - Guaranteed to handle None return from create_initial_state
-    - Better session ID persistence throughout workflow
-    - Improved error handling and recovery
-    - Enhanced state management
-    - More detailed logging and debugging
-    - Robust conversation saving with fallbacks
-    """
     # Initialize correlation tracking for this request
     correlation_id = start_request_tracking(session_id)
     
@@ -360,32 +437,26 @@ def run_agentic_askimmigrate(text: str, session_id: Optional[str] = None) -> Dic
         question_length=len(text),
         session_id=session_id
     )
+    return correlation_id
+
+
+def _prepare_workflow_state(text: str, session_id: Optional[str], correlation_id: str) -> tuple:
+    """
+    Build the initial state with emergency fallbacks.
+    
+    Returns:
+        tuple: (initial_state, actual_session_id)
+    """
+    now_iso = datetime.now().isoformat()
     
-    # CRITICAL FIX: Handle potential None return from create_initial_state
     try:
         with PerformanceTimer(workflow_logger, "initial_state_creation", correlation_id=correlation_id):
-            initial_state = create_initial_state(text, session_id)
-        
-        # GUARANTEE we have a valid state
-        if initial_state is None:
-            workflow_logger.error(
-                "initial_state_creation_returned_none",
-                correlation_id=correlation_id,
-                session_id=session_id
-            )
-            initial_state = ImmigrationState(
-                text=text,
-                session_id=session_id or f"emergency-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-                conversation_history=[],
-                session_context=SessionContext(),
-                is_followup_question=False,
-                conversation_turn_number=1
-            )
+            initial_state = create_initial_state(text, session_id, now_iso=now_iso)
         
         actual_session_id = initial_state.get("session_id")
         
         if not actual_session_id:
-            fallback_session_id = f"fallback-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            fallback_session_id = _timestamped_session_id("fallback")
             initial_state["session_id"] = fallback_session_id
             
             workflow_logger.warning(
@@ -404,113 +475,73 @@ def run_agentic_askimmigrate(text: str, session_id: Optional[str] = None) -> Dic
         )
         
         # Create emergency fallback state
-        actual_session_id = f"emergency-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        initial_state = ImmigrationState(
-            text=text,
-            session_id=actual_session_id,
-            conversation_history=[],
-            session_context=SessionContext(),
-            is_followup_question=False,
-            conversation_turn_number=1
-        )
+        actual_session_id = _timestamped_session_id("emergency")
+        initial_state = _fallback_state(text, actual_session_id)
         workflow_logger.info("emergency_state_created", 
                           correlation_id=correlation_id, 
                           session_id=actual_session_id)
     
-    try:
-        # Create and run the enhanced graph
-        with PerformanceTimer(workflow_logger, "graph_creation", correlation_id=correlation_id):
-            graph = create_ask_immigrate_graph()
-        
-        # Visualize only on first run to avoid spam
-        if not session_id or initial_state.get("conversation_turn_number", 1) == 1:
-            visualize_graph(graph)
-        
-        with PerformanceTimer(workflow_logger, "workflow_execution", 
-                            correlation_id=correlation_id, session_id=actual_session_id):
-            final_state = graph.invoke(initial_state)
-        
-        workflow_logger.info("workflow_execution_successful", 
-                          correlation_id=correlation_id, 
-                          session_id=actual_session_id)
-        
-        # CRITICAL FIX: Ensure session ID is preserved in final state
-        if actual_session_id and actual_session_id not in [None, ""]:
-            final_state["session_id"] = actual_session_id
-            workflow_logger.info("session_id_preserved", 
-                              correlation_id=correlation_id, 
-                              session_id=actual_session_id)
-            
-            # IMPROVED: Save conversation with enhanced error handling
-            try:
-                save_conversation_result(final_state)
-            except Exception as save_error:
-                workflow_logger.error("conversation_save_post_workflow_failed",
-                                   correlation_id=correlation_id,
-                                   session_id=actual_session_id,
-                                   error_message=str(save_error))
-        else:
-            workflow_logger.warning("no_valid_session_id_for_save", 
-                                 correlation_id=correlation_id)
-        
-        # IMPROVED: Enhanced result summary with better data extraction
-        workflow_logger.info(
-            "workflow_execution_summary",
-            correlation_id=correlation_id,
-            session_id=actual_session_id,
-            turn_number=final_state.get("conversation_turn_number", 1),
-            is_followup=final_state.get("is_followup_question", False),
-            tools_used_count=len(final_state.get("tools_used", [])),
-            synthesis_length=len(final_state.get("synthesis", ""))
-        )
-        
-        # Session info
-        if actual_session_id:
-            turn_num = final_state.get("conversation_turn_number", 1)
-            is_followup = final_state.get("is_followup_question", False)
-            print(f"📱 Session: {actual_session_id}")
-            print(f"🔢 Turn: #{turn_num}")
-            print(f"🔗 Follow-up: {is_followup}")
-        
-        # Manager analysis
-        structured_analysis = final_state.get("structured_analysis", {})
-        if structured_analysis:
-            print(f"🎯 Question Type: {structured_analysis.get('question_type', 'unknown')}")
-            print(f"🎯 Complexity: {structured_analysis.get('complexity', 'unknown')}")
-            print(f"🎯 Primary Focus: {structured_analysis.get('primary_focus', 'general')}")
-            print(f"🎯 Visa Focus: {structured_analysis.get('visa_focus', [])}")
-        
-        # Tool usage
-        tools_used = final_state.get("tools_used", [])
-        print(f"🔧 Tools Used: {len(tools_used)} ({', '.join(tools_used) if tools_used else 'none'})")
-        
-        # Quality control
-        revision_round = final_state.get("revision_round", 0)
-        print(f"🔍 Review Rounds: {revision_round}")
-        
-        # Response metrics
-        synthesis = final_state.get("synthesis", "")
-        print(f"📝 Response Length: {len(synthesis)} characters")
-        
-        # IMPROVED: Add session ID to return data for external use
-        final_state["session_id"] = actual_session_id
-        
-        return final_state
-        
-    except Exception as e:
-        workflow_logger.error(
-            "workflow_execution_failed",
-            correlation_id=correlation_id,
-            session_id=actual_session_id,
-            error_type=type(e).__name__,
-            error_message=str(e)
-        )
-        
-        error_msg = f"Strategic workflow execution failed: {str(e)}"
-        
-        # IMPROVED: Better error state with session preservation
-        error_state = {
-            "synthesis": f"""# Immigration Assistant Error
+    return initial_state, actual_session_id
+
+
+def _complete_workflow(final_state: Dict[str, Any], correlation_id: str,
+                       actual_session_id: Optional[str]) -> Dict[str, Any]:
+    """Persist the turn and report the summary for a successful run."""
+    workflow_logger.info("workflow_execution_successful", 
+                      correlation_id=correlation_id, 
+                      session_id=actual_session_id)
+    
+    # session_id rides through the graph from the initial state, which
+    # _prepare_workflow_state guarantees is non-empty - no need to re-set it.
+    # save_conversation_result logs and swallows its own failures.
+    save_conversation_result(final_state)
+    
+    # IMPROVED: Enhanced result summary with better data extraction
+    workflow_logger.info(
+        "workflow_execution_summary",
+        correlation_id=correlation_id,
+        session_id=actual_session_id,
+        turn_number=final_state.get("conversation_turn_number", 1),
+        is_followup=final_state.get("is_followup_question", False),
+        tools_used_count=len(final_state.get("tools_used") or ()),
+        synthesis_length=len(final_state.get("synthesis") or "")
+    )
+    
+    return final_state
+
+
+def format_workflow_summary(final_state: Dict[str, Any]) -> str:
+    """
+    Human-readable run summary for terminal callers (CLI, __main__).
+    
+    Kept out of the workflow itself so server requests don't pay for stdout I/O.
+    """
+    lines = [
+        f"📱 Session: {final_state.get('session_id')}",
+        f"🔢 Turn: #{final_state.get('conversation_turn_number', 1)}",
+        f"🔗 Follow-up: {final_state.get('is_followup_question', False)}",
+    ]
+    
+    # Manager analysis
+    structured_analysis = final_state.get("structured_analysis")
+    if structured_analysis:
+        lines.append(f"🎯 Question Type: {structured_analysis.get('question_type', 'unknown')}")
+        lines.append(f"🎯 Complexity: {structured_analysis.get('complexity', 'unknown')}")
+        lines.append(f"🎯 Primary Focus: {structured_analysis.get('primary_focus', 'general')}")
+        lines.append(f"🎯 Visa Focus: {structured_analysis.get('visa_focus', [])}")
+    
+    # Tool usage
+    tools_used = final_state.get("tools_used") or []
+    lines.append(f"🔧 Tools Used: {len(tools_used)} ({', '.join(tools_used) if tools_used else 'none'})")
+    
+    # Quality control and response metrics
+    lines.append(f"🔍 Review Rounds: {final_state.get('revision_round', 0)}")
+    lines.append(f"📝 Response Length: {len(final_state.get('synthesis') or '')} characters")
+    return "\n".join(lines)
+
+
+# User-facing error page; only the question and error are filled in per failure
+_ERROR_MARKDOWN_TEMPLATE = """# Immigration Assistant Error
 
 ## ⚠️ Processing Issue
 
@@ -533,34 +564,141 @@ For immediate help with immigration questions:
 - Consult with a qualified immigration attorney for legal advice
 
 *This error has been logged. Our team will work to improve the system.*
-""",
-            "error": error_msg,
-            "manager_decision": "Workflow failed during execution",
-            "tool_results": {},
-            "tools_used": [],
-            "text": text,
-            "session_id": actual_session_id,  # Preserve session even in error
-            "workflow_parameters": {
-                "question_type": "error",
-                "complexity": "unknown",
-                "primary_focus": "error handling"
-            }
-        }
+"""
+
+
+def _workflow_error_result(e: Exception, text: str, correlation_id: str,
+                           actual_session_id: Optional[str]) -> Dict[str, Any]:
+    """Build (and try to save) the user-facing error state for a failed run."""
+    workflow_logger.error(
+        "workflow_execution_failed",
+        correlation_id=correlation_id,
+        session_id=actual_session_id,
+        error_type=type(e).__name__,
+        error_message=str(e)
+    )
+    
+    error_msg = f"Strategic workflow execution failed: {str(e)}"
+    
+    # Only what callers and save_conversation_result read; no empty tool/analysis scaffolding
+    error_state = {
+        "synthesis": _ERROR_MARKDOWN_TEMPLATE.format(text=text, error_msg=error_msg),
+        "error": error_msg,
+        "manager_decision": "Workflow failed during execution",
+        "tools_used": [],
+        "text": text,
+        "session_id": actual_session_id,  # Preserve session even in error
+        # save_conversation_result tags the turn from structured_analysis
+        "structured_analysis": {"question_type": "error"},
+    }
+    
+    # IMPROVED: Still try to save error to session for debugging
+    # (single attempt; save_conversation_result logs its own failures)
+    if actual_session_id:
+        save_conversation_result(error_state)
+    
+    return error_state
+
+
+def run_agentic_askimmigrate(text: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Enhanced function to run the strategic immigration workflow with COMPLETE session support.
+    
+    Synchronous entry point for the CLI and thread-pool callers; async callers
+    should use arun_agentic_askimmigrate.
+    
+    CRITICAL FIXES:
+    - Guaranteed to handle None return from create_initial_state
+    - Better session ID persistence throughout workflow
+    - Improved error handling and recovery
+    - Enhanced state management
+    - More detailed logging and debugging
+    - Robust conversation saving with fallbacks
+    """
+    correlation_id = _begin_workflow_request(text, session_id)
+    initial_state, actual_session_id = _prepare_workflow_state(text, session_id, correlation_id)
+    
+    try:
+        # Run the shared compiled graph
+        graph = get_compiled_graph()
+        
+        with PerformanceTimer(workflow_logger, "workflow_execution", 
+                            correlation_id=correlation_id, session_id=actual_session_id):
+            final_state = graph.invoke(initial_state)
+        
+        return _complete_workflow(final_state, correlation_id, actual_session_id)
+        
+    except Exception as e:
+        return _workflow_error_result(e, text, correlation_id, actual_session_id)
+
+
+async def arun_agentic_askimmigrate(text: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async variant of run_agentic_askimmigrate for FastAPI and other event-loop callers.
+    
+    The graph runs through ainvoke so the loop is free while nodes wait on
+    LLM/tool I/O; SQLite session reads and writes run in worker threads.
+    """
+    correlation_id = _begin_workflow_request(text, session_id)
+    initial_state, actual_session_id = await asyncio.to_thread(
+        _prepare_workflow_state, text, session_id, correlation_id
+    )
+    
+    try:
+        graph = get_compiled_graph()
+        
+        with PerformanceTimer(workflow_logger, "workflow_execution", 
+                            correlation_id=correlation_id, session_id=actual_session_id):
+            final_state = await graph.ainvoke(initial_state)
+        
+        return await asyncio.to_thread(_complete_workflow, final_state, correlation_id, actual_session_id)
+        
+    except Exception as e:
+        return await asyncio.to_thread(_workflow_error_result, e, text, correlation_id, actual_session_id)
+
+async def stream_agentic_askimmigrate(
+    text: str, session_id: Optional[str] = None
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Streaming variant of arun_agentic_askimmigrate.
+    
+    Yields ("token", delta) for each synthesis token as the LLM produces it,
+    then a single ("final", final_state) once the graph finishes and the turn
+    is saved. A reviewer-requested revision streams its new draft as well, so
+    the final state's "synthesis" is the authoritative answer.
+    """
+    correlation_id = _begin_workflow_request(text, session_id)
+    initial_state, actual_session_id = await asyncio.to_thread(
+        _prepare_workflow_state, text, session_id, correlation_id
+    )
+    
+    try:
+        from backend.code.agent_nodes.synthesis_node import SYNTHESIS_ANSWER_TAG
         
-        # IMPROVED: Still try to save error to session for debugging
-        if actual_session_id:
-            try:
-                save_conversation_result(error_state)
-                workflow_logger.info("error_state_saved_to_session", 
-                                  correlation_id=correlation_id, 
-                                  session_id=actual_session_id)
-            except Exception as session_save_error:
-                workflow_logger.warning("error_state_session_save_failed",
-                                      correlation_id=correlation_id,
-                                      session_id=actual_session_id,
-                                      error_message=str(session_save_error))
+        graph = get_compiled_graph()
+        final_state = None
         
-        return error_state
+        with PerformanceTimer(workflow_logger, "workflow_execution", 
+                            correlation_id=correlation_id, session_id=actual_session_id):
+            async for event in graph.astream_events(initial_state, version="v2"):
+                kind = event["event"]
+                if kind == "on_chat_model_stream" and SYNTHESIS_ANSWER_TAG in event.get("tags", ()):
+                    delta = event["data"]["chunk"].content
+                    if delta:
+                        yield "token", delta
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    # The root run's end event carries the graph's final state
+                    final_state = event["data"]["output"]
+        
+        if final_state is None:
+            raise RuntimeError("Workflow stream ended without a final state")
+        
+        result = await asyncio.to_thread(_complete_workflow, final_state, correlation_id, actual_session_id)
+        
+    except Exception as e:
+        result = await asyncio.to_thread(_workflow_error_result, e, text, correlation_id, actual_session_id)
+    
+    yield "final", result
 
 def list_sessions() -> List[Dict[str, Any]]:
     """
@@ -589,12 +727,16 @@ if __name__ == "__main__":
     
     print(f"🧪 Testing with session: {test_session_id}")
     
+    # Rendering is off the request path; write the image once for the harness
+    visualize_graph(get_compiled_graph())
+    
     for i, (question, description) in enumerate(test_conversations, 1):
         print(f"\n🧪 TEST {i}/{len(test_conversations)}: {description}")
         print("=" * 60)
         
         try:
             results = run_agentic_askimmigrate(text=question, session_id=test_session_id)
+            print(format_workflow_summary(results))
             
             if "error" not in results:
                 response_length = len(results.get("synthesis", ""))
@@ -616,8 +758,7 @@ if __name__ == "__main__":
     # List final session state
     print(f"\n📱 Final Session State for {test_session_id}:")
     try:
-        sessions = list_sessions()
-        test_session = next((s for s in sessions if s['session_id'] == test_session_id), None)
+        test_session = session_manager.get_session(test_session_id)
         if test_session:
             print(f"  • Turns: {test_session['turn_count']}")
             print(f"  • Last active: {test_session['updated_at']}")
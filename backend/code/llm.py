@@ -1,26 +1,63 @@
 import os
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-from langchain_groq import ChatGroq
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.language_models.chat_models import BaseChatModel
 from dotenv import load_dotenv
 
-load_dotenv()
+_ENV_LOADED = False
+
+
+def ensure_env_loaded() -> None:
+    """Load .env once per process, when a model is first built rather than at import."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+# Provider SDKs are imported inside their factory so a process only pays the
+# import cost of the providers it actually uses.
+def _make_gemini(model_name: str, temperature: float, client_kwargs: dict) -> BaseChatModel:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        max_retries=3,
+        temperature=temperature,
+        google_api_key=os.getenv("GEMINI_API_KEY")
+    )
+
+
+def _make_openai(model_name: str, temperature: float, client_kwargs: dict) -> BaseChatModel:
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=model_name, temperature=temperature, **client_kwargs)
+
+
+def _make_groq(model_name: str, temperature: float, client_kwargs: dict) -> BaseChatModel:
+    from langchain_groq import ChatGroq
+    return ChatGroq(model=model_name, temperature=temperature, **client_kwargs)
+
+
+# model name -> factory(model_name, temperature, client_kwargs)
+_LLM_FACTORIES = {
+    "gemini-2.5-flash": _make_gemini,
+    "gpt-4o-mini": _make_openai,
+    "gpt-4o": _make_openai,
+    "llama3-8b-8192": _make_groq,
+}
+
 
 def get_llm(model_name: str, temperature: float = 0.2) -> BaseChatModel:
-    if model_name == "gemini-2.5-flash":
-        return ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash", 
-            max_retries=3, 
-            temperature=temperature,
-            google_api_key=os.getenv("GEMINI_API_KEY")
-        )
-    elif model_name == "gpt-4o-mini":
-        return ChatOpenAI(model="gpt-4o-mini", temperature=temperature)
-    elif model_name == "gpt-4o":
-        return ChatOpenAI(model="gpt-4o", temperature=temperature)
-    elif model_name == "llama3-8b-8192":
-        return ChatGroq(model="llama3-8b-8192", temperature=temperature)
-    else:
-        raise ValueError(f"Unknown model name: {model_name}")
\ No newline at end of file
+    return build_llm(model_name, temperature)
+
+
+def build_llm(model_name: str, temperature: float = 0.2, **client_kwargs) -> BaseChatModel:
+    """
+    Build a chat model by name.
+
+    client_kwargs (e.g. shared ``http_client``/``http_async_client`` for
+    connection pooling) are forwarded to the OpenAI and Groq models; the
+    Gemini client manages its own transport and ignores them.
+    """
+    factory = _LLM_FACTORIES.get(model_name)
+    if factory is None:
+        raise ValueError(f"Unknown model name: {model_name}")
+    ensure_env_loaded()
+    return factory(model_name, temperature, client_kwargs)
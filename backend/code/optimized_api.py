@@ -2,17 +2,23 @@
 Optimized API endpoints with streaming support for 90% performance improvement.
 """
 import asyncio
-import json
 import time
 from typing import AsyncGenerator, Optional
 
+import orjson
+
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from backend.code.fast_workflow import run_optimized_workflow, streaming_manager
-from backend.code.async_utils import should_use_fast_path, _query_cache
+from backend.code.fast_workflow import (
+    run_optimized_workflow_async,
+    fast_path_stream,
+    choose_fast_path,
+    warm_llm_for_running_loop,
+)
+from backend.code.async_utils import _query_cache, _async_manager
 from backend.code.session_manager import session_manager
 from backend.code.utils import create_anonymous_session_id
 
@@ -32,7 +38,7 @@ class StreamingQueryResponse:
         self.session_id = session_id or create_anonymous_session_id(client_fingerprint, query)
         self.start_time = time.time()
         
-    async def stream_response(self) -> AsyncGenerator[str, None]:
+    async def stream_response(self) -> AsyncGenerator[bytes, None]:
         """Stream the query response with progress updates."""
         
         # Stage 1: Immediate acknowledgment
@@ -50,7 +56,8 @@ class StreamingQueryResponse:
             "timestamp": time.time()
         })
         
-        cached_response = _query_cache.get_similar_response(self.query)
+        # The lookup may embed the query on the CPU, so keep it off the event loop
+        cached_response = await asyncio.to_thread(_query_cache.get_similar_response, self.query)
         if cached_response:
             yield self._format_stream_data({
                 "stage": "cache_hit", 
@@ -68,8 +75,11 @@ class StreamingQueryResponse:
             })
             return
         
-        # Stage 3: Determine processing path
-        use_fast_path = should_use_fast_path(self.query)
+        # Stage 3: Determine processing path once (cache already missed) and pass it through;
+        # the history read is SQLite I/O, so keep it off the event loop
+        use_fast_path = await asyncio.to_thread(
+            choose_fast_path, self.query, self.session_id, False
+        )
         processing_type = "fast_path" if use_fast_path else "full_workflow"
         estimated_time = "3-5 seconds" if use_fast_path else "15-25 seconds"
         
@@ -96,8 +106,42 @@ class StreamingQueryResponse:
         
         # Stage 5: Execute processing
         try:
-            # Run the workflow (this handles async internally)
-            result = run_optimized_workflow(self.query, self.session_id)
+            result = None
+            if use_fast_path:
+                # Stream tokens as they are decoded so the first words arrive early
+                parts = []
+                try:
+                    async for delta in fast_path_stream(self.query, self.session_id):
+                        parts.append(delta)
+                        yield self._format_stream_data({
+                            "stage": "token",
+                            "delta": delta,
+                            "timestamp": time.time()
+                        })
+                    result = {
+                        "synthesis": "".join(parts),
+                        "session_id": self.session_id,
+                        "fast_path": True,
+                        "cache_hit": False
+                    }
+                except Exception:
+                    if parts:
+                        raise
+                    # Nothing sent yet - fall back to the full workflow below
+            
+            if result is None:
+                # Run the workflow on the server's own event loop, forwarding
+                # synthesis tokens as the LLM produces them
+                from backend.code.graph_workflow import stream_agentic_askimmigrate
+                async for kind, payload in stream_agentic_askimmigrate(self.query, self.session_id):
+                    if kind == "token":
+                        yield self._format_stream_data({
+                            "stage": "token",
+                            "delta": payload,
+                            "timestamp": time.time()
+                        })
+                    else:
+                        result = payload
             
             # Stage 6: Complete
             processing_time = time.time() - self.start_time
@@ -125,9 +169,9 @@ class StreamingQueryResponse:
                 "timestamp": time.time()
             })
     
-    def _format_stream_data(self, data: dict) -> str:
+    def _format_stream_data(self, data: dict) -> bytes:
         """Format data for SSE streaming."""
-        return f"data: {json.dumps(data)}\n\n"
+        return b"data: " + orjson.dumps(data, default=str) + b"\n\n"
 
 
 # Create optimized FastAPI app
@@ -143,6 +187,18 @@ optimized_app.add_middleware(
 )
 
 
+@optimized_app.on_event("startup")
+async def warm_llm_pool():
+    """Build this loop's pooled LLM client before the first request arrives."""
+    warm_llm_for_running_loop()
+
+
+@optimized_app.on_event("shutdown")
+async def close_http_clients():
+    """Close this loop's pooled LLM HTTP client on the loop that owns it."""
+    await _async_manager.aclose_http_clients()
+
+
 @optimized_app.post("/query/stream")
 async def stream_query(request: OptimizedQueryRequest):
     """
@@ -187,7 +243,7 @@ async def query_optimized(request: OptimizedQueryRequest):
     
     try:
         # Execute optimized workflow
-        result = run_optimized_workflow(request.question, session_id)
+        result = await run_optimized_workflow_async(request.question, session_id)
         
         processing_time = time.time() - start_time
         
@@ -19,6 +19,9 @@ try:
     OUTPUTS_DIR = os.path.join(ROOT_DIR, "outputs")
     APP_CONFIG_FPATH = os.path.join(ROOT_DIR, "config", "config.yaml")
     PROMPT_CONFIG_FPATH = os.path.join(ROOT_DIR, "config", "prompt_config.yaml")
+    ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+    # Pre-rendered by code/scripts/build_workflow_png.py (make workflow-png)
+    WORKFLOW_GRAPH_PNG_FPATH = os.path.join(ASSETS_DIR, "enhanced_immigration_workflow.png")
 
     # Inside the code directory
     GAZETTEER_ENTITIES_FILE_PATH = os.path.join(CODE_DIR, "gazetteer_entities.yaml")
@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional, Union
 
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
 
 def lowercase_first_char(text: str) -> str:
     """Lowercases the first character of a string.
@@ -79,11 +81,7 @@ def build_prompt_from_config(
         prompt_parts.append(f"Your goal is to achieve the following outcome:\n{goal}")
 
     if input_data:
-        prompt_parts.append(
-            "Here is the content you need to work with:\n"
-            "<<<BEGIN CONTENT>>>\n"
-            "```\n" + input_data.strip() + "\n```\n<<<END CONTENT>>>"
-        )
+        prompt_parts.append(format_content_block(input_data))
 
     reasoning_strategy = config.get("reasoning_strategy")
     if reasoning_strategy and reasoning_strategy != "None" and app_config:
@@ -95,6 +93,42 @@ def build_prompt_from_config(
     return "\n\n".join(prompt_parts)
 
 
+def format_content_block(input_data: str) -> str:
+    """Wraps per-request content in the delimiters used by build_prompt_from_config."""
+    return (
+        "Here is the content you need to work with:\n"
+        "<<<BEGIN CONTENT>>>\n"
+        "```\n" + input_data.strip() + "\n```\n<<<END CONTENT>>>"
+    )
+
+
+def build_prompt_messages(
+    config: Dict[str, Any],
+    input_data: str = "",
+    app_config: Optional[Dict[str, Any]] = None,
+) -> List[BaseMessage]:
+    """Builds a prompt as a stable system message plus a per-request human message.
+
+    The system message depends only on the config, so it is byte-identical
+    across requests and turns. Providers with prefix caching (OpenAI automatic
+    caching, Gemini implicit caching) can then reuse it instead of re-reading
+    it on every call.
+
+    Args:
+        config: Dictionary specifying prompt components.
+        input_data: Per-request content placed in the human message.
+        app_config: Optional app config used to resolve reasoning strategies.
+
+    Returns:
+        A [SystemMessage, HumanMessage] pair.
+    """
+    system_prompt = build_prompt_from_config(config, app_config=app_config)
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=format_content_block(input_data)),
+    ]
+
+
 def print_prompt_preview(prompt: str, max_length: int = 500) -> None:
     """Prints a preview of the constructed prompt for debugging purposes.
 
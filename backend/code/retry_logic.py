@@ -7,6 +7,7 @@ This module provides decorators and utilities for handling transient failures
 in LLM calls, tool executions, and database operations with proper logging.
 """
 
+import re
 import time
 import random
 import functools
@@ -39,6 +40,41 @@ class DatabaseRetryableError(RetryableError):
     """Specific exception for database-related retryable errors."""
     pass
 
+# Message fragments of transient failures worth retrying, matched case-insensitively
+RETRYABLE_ERROR_PATTERNS = (
+    # Network-related errors
+    "Connection timeout",
+    "Connection refused",
+    "Connection reset",
+    "Network unreachable",
+    "DNS lookup failed",
+    "SSL handshake failed",
+    "Read timeout",
+    "Request timeout",
+    # API-related errors
+    "Rate limit exceeded",
+    "Service unavailable",
+    "Internal server error",
+    "Bad gateway",
+    "Gateway timeout",
+    "Service temporarily unavailable",
+    "Temporary failure",
+    "Too many requests",
+    # LLM-specific errors
+    "Model overloaded",
+    "Context length exceeded",
+    "Token limit exceeded",
+    "API quota exceeded",
+    "Model temporarily unavailable",
+    # Database errors
+    "Database connection lost",
+    "Transaction deadlock",
+    "Lock timeout",
+    "Connection pool exhausted",
+)
+# One lowercased alternation: a single scan per error message instead of one per pattern
+_RETRYABLE_ERROR_RE = re.compile("|".join(re.escape(pattern.lower()) for pattern in RETRYABLE_ERROR_PATTERNS))
+
 def is_retryable_error(exception: Exception) -> bool:
     """
     Determine if an exception should trigger a retry.
@@ -49,56 +85,12 @@ def is_retryable_error(exception: Exception) -> bool:
     Returns:
         True if the exception should trigger a retry
     """
-    # Network-related errors
-    network_errors = [
-        "Connection timeout",
-        "Connection refused",
-        "Connection reset",
-        "Network unreachable",
-        "DNS lookup failed",
-        "SSL handshake failed",
-        "Read timeout",
-        "Request timeout"
-    ]
-    
-    # API-related errors
-    api_errors = [
-        "Rate limit exceeded",
-        "Service unavailable",
-        "Internal server error",
-        "Bad gateway",
-        "Gateway timeout",
-        "Service temporarily unavailable",
-        "Temporary failure",
-        "Too many requests"
-    ]
-    
-    # LLM-specific errors
-    llm_errors = [
-        "Model overloaded",
-        "Context length exceeded",
-        "Token limit exceeded",
-        "API quota exceeded",
-        "Model temporarily unavailable"
-    ]
-    
-    # Database errors
-    db_errors = [
-        "Database connection lost",
-        "Transaction deadlock",
-        "Lock timeout",
-        "Connection pool exhausted"
-    ]
-    
-    error_message = str(exception).lower()
-    
     # Check if it's explicitly a retryable error type
     if isinstance(exception, RetryableError):
         return True
     
     # Check for known retryable patterns
-    all_retryable_patterns = network_errors + api_errors + llm_errors + db_errors
-    return any(pattern.lower() in error_message for pattern in all_retryable_patterns)
+    return _RETRYABLE_ERROR_RE.search(str(exception).lower()) is not None
 
 def calculate_delay(attempt: int, config: RetryConfig) -> float:
     """
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Pre-render the workflow graph image at build time.
+
+The graph topology is static, so the PNG is rendered once here (one call to
+the Mermaid API) and shipped in backend/assets/. At runtime visualize_graph
+copies this file instead of calling the API.
+
+Usage (from the project root): python -m backend.code.scripts.build_workflow_png
+"""
+
+import os
+
+from langchain_core.runnables.graph import MermaidDrawMethod
+
+from backend.code.graph_workflow import create_ask_immigrate_graph
+from backend.code.paths import WORKFLOW_GRAPH_PNG_FPATH
+
+
+def build_workflow_png(output_path: str = WORKFLOW_GRAPH_PNG_FPATH) -> str:
+    """Render the compiled workflow graph to PNG and write it to output_path."""
+    png = create_ask_immigrate_graph().get_graph().draw_mermaid_png(
+        draw_method=MermaidDrawMethod.API
+    )
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(png)
+    return output_path
+
+
+if __name__ == "__main__":
+    print(f"🖼️  Workflow graph written to {build_workflow_png()}")
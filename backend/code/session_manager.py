@@ -1,8 +1,17 @@
+import atexit
 import json
+import queue
 import sqlite3
 import os
+import re
+import threading
+import time
+import traceback
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+
+import orjson
+
 from backend.code.agentic_state import ConversationTurn, SessionContext, ImmigrationState
 from backend.code.paths import OUTPUTS_DIR
 from backend.code.structured_logging import get_logger, PerformanceTimer, start_request_tracking
@@ -12,6 +21,29 @@ session_logger = get_logger("session_manager")
 
 SESSIONS_DB_PATH = os.path.join(OUTPUTS_DIR, "agentic_sessions.db")
 
+
+def _json_text(value: Any) -> str:
+    """Encode a value for a JSON TEXT column; orjson is several times faster than json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Pre-encoded empty object for new sessions and turns without metadata
+_EMPTY_JSON_OBJECT = "{}"
+
+
+class SessionSnapshot(NamedTuple):
+    """Everything create_initial_state needs about a session, loaded together."""
+    session_info: Dict[str, Any]
+    conversation_history: List[ConversationTurn]
+    
+    def build_context_string(self) -> str:
+        """Same text as build_session_context_string, rendered from the loaded data."""
+        # build_session_context_string only looks at the first three stored turns
+        return SessionManager._format_session_context_string(
+            self.session_info["session_id"], self.session_info, self.conversation_history[:3]
+        )
+
+
 class SessionManager:
     """
     Enhanced session manager for agentic workflow with comprehensive debugging.
@@ -24,8 +56,56 @@ class SessionManager:
     - Added comprehensive logging for debugging
     """
     
+    # Seconds a loaded history stays valid; writes through save_conversation_turn invalidate sooner
+    HISTORY_CACHE_TTL = 60.0
+    
+    # The only final_state keys save_conversation_turn reads; queued turns keep just these
+    TURN_STATE_KEYS = ("synthesis_metadata", "structured_analysis", "question_type", "complexity")
+    
+    # Follow-up detection phrases, matched as plain substrings of the lowercased question
+    # Expanded strong follow-up indicators for better detection
+    FOLLOWUP_INDICATORS = (
+        "it", "that", "this", "what about", "can i also", "and what", "follow up",
+        "additionally", "furthermore", "next step", "after that", "my first", "previous",
+        "earlier", "before", "what did i", "what was", "tell me more", "more details",
+        "can you elaborate", "could you clarify", "expand on", "continue", "go on",
+        "what happened next", "what else", "also", "besides", "in addition", "related to",
+        "regarding that", "regarding this", "about that", "about this", "as mentioned",
+        "as discussed", "as you said", "as you mentioned", "as stated", "as explained"
+    )
+    # Session reference indicators (very strong)
+    SESSION_REFERENCES = (
+        "first", "previous", "earlier", "what did i", "what was", "before", "last",
+        "my last question", "my previous question", "the last answer", "the previous answer",
+        "the last one", "the previous one", "the earlier one", "the earlier question",
+        "the earlier answer", "the answer you gave", "the question before", "the answer before",
+        "the one before", "the one you just answered", "the one you just gave", "the last response",
+        "the previous response", "the earlier response"
+    )
+    # Expanded immigration-related terms for better detection
+    FOLLOWUP_IMMIGRATION_TERMS = (
+        "visa", "green card", "citizenship", "naturalization", "h1b", "f1", "opt", "uscis", "immigration",
+        "permanent resident", "work permit", "asylum", "refugee", "i-140", "i-485", "i-20", "ds-160",
+        "eb-1", "eb-2", "eb-3", "l1", "j1", "b2", "e2", "o1", "tn", "daca", "advance parole", "us consulate",
+        "petition", "sponsor", "interview", "status", "application", "case number", "priority date"
+    )
+    # One alternation per list: a single scan per question instead of one per phrase
+    _FOLLOWUP_INDICATORS_RE = re.compile("|".join(map(re.escape, FOLLOWUP_INDICATORS)))
+    _SESSION_REFERENCES_RE = re.compile("|".join(map(re.escape, SESSION_REFERENCES)))
+    _FOLLOWUP_IMMIGRATION_TERMS_RE = re.compile("|".join(map(re.escape, FOLLOWUP_IMMIGRATION_TERMS)))
+    
     def __init__(self, db_path: str = SESSIONS_DB_PATH):
         self.db_path = db_path
+        # {(session_id, limit): (loaded_at, turns)}
+        self._history_cache: Dict[Tuple[str, int], Tuple[float, List[ConversationTurn]]] = {}
+        # {session_id: (loaded_at, session_info)} - kept current by save_conversation_turn
+        self._session_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._history_lock = threading.Lock()
+        # Background turn writer, started on first enqueue_conversation_turn
+        self._turn_queue: "queue.Queue[Tuple[str, ConversationTurn, Dict[str, Any]]]" = queue.Queue()
+        self._pending_turns: Dict[str, int] = {}
+        self._pending_turns_cond = threading.Condition()
+        self._turn_writer: Optional[threading.Thread] = None
         self._init_database()
         session_logger.info("session_manager_initialized", db_path=db_path)
     
@@ -163,7 +243,7 @@ class SessionManager:
                             "created_at": session["created_at"],
                             "updated_at": session["updated_at"],
                             "turn_count": session["turn_count"],
-                            "session_context": json.loads(session["session_context"]) if session["session_context"] else {}
+                            "session_context": orjson.loads(session["session_context"]) if session["session_context"] else {}
                         }
                         session_logger.info("session_data_retrieved", 
                                           session_id=session_id, 
@@ -176,7 +256,7 @@ class SessionManager:
                         conn.execute(
                             """INSERT INTO sessions (session_id, session_context) 
                                VALUES (?, ?)""",
-                            (session_id, json.dumps({}))
+                            (session_id, _EMPTY_JSON_OBJECT)
                         )
                         
                         # Verify creation
@@ -207,6 +287,104 @@ class SessionManager:
             )
             raise
     
+    def _invalidate_history_cache(self, session_id: str) -> None:
+        """Drop cached history and session info for a session after it changes."""
+        with self._history_lock:
+            for key in [key for key in self._history_cache if key[0] == session_id]:
+                del self._history_cache[key]
+            self._session_info_cache.pop(session_id, None)
+    
+    def _write_through_turn(self, session_id: str, turn: ConversationTurn, turn_count: int,
+                            session_context: Dict[str, Any], updated_at: str) -> None:
+        """
+        Apply a just-committed turn to the caches instead of dropping them, so the
+        next request in this session is served without re-reading the DB.
+        
+        History is cached oldest-first with a LIMIT, so the new turn is appended
+        only to entries that are not yet full; full entries are unchanged.
+        """
+        now = time.monotonic()
+        with self._history_lock:
+            cached_info = self._session_info_cache.get(session_id)
+            if cached_info:
+                self._session_info_cache[session_id] = (now, {
+                    **cached_info[1],
+                    "turn_count": turn_count,
+                    "updated_at": updated_at,
+                    "session_context": session_context,
+                })
+            for key in [key for key in self._history_cache if key[0] == session_id]:
+                turns = self._history_cache[key][1]
+                if len(turns) < key[1]:
+                    turns = turns + [turn]
+                self._history_cache[key] = (now, turns)
+    
+    def enqueue_conversation_turn(self, session_id: str, turn: ConversationTurn,
+                                  final_state: ImmigrationState) -> None:
+        """
+        Save a turn on the background writer thread instead of the caller's.
+        
+        Readers of a session's turns wait for that session's queued writes
+        (wait_for_pending_turns), so a follow-up never sees stale history.
+        """
+        session_id = self._sanitize_session_id(session_id)
+        state_snapshot = {key: final_state[key] for key in self.TURN_STATE_KEYS if key in final_state}
+        
+        with self._pending_turns_cond:
+            self._pending_turns[session_id] = self._pending_turns.get(session_id, 0) + 1
+            if self._turn_writer is None:
+                self._turn_writer = threading.Thread(
+                    target=self._drain_turn_queue, name="session-turn-writer", daemon=True
+                )
+                self._turn_writer.start()
+                # Short-lived processes (CLI) must not exit with turns still queued
+                atexit.register(self.flush_pending_turns)
+        
+        self._turn_queue.put((session_id, turn, state_snapshot))
+        session_logger.debug("conversation_turn_queued", session_id=session_id,
+                             queue_depth=self._turn_queue.qsize())
+    
+    def _drain_turn_queue(self) -> None:
+        """Writer thread loop: persist queued turns in arrival order."""
+        while True:
+            session_id, turn, state_snapshot = self._turn_queue.get()
+            try:
+                # Logs and swallows its own DB failures
+                self.save_conversation_turn(session_id, turn, state_snapshot)
+            except Exception as e:
+                session_logger.error("background_turn_save_failed",
+                                     session_id=session_id,
+                                     error_type=type(e).__name__,
+                                     error_message=str(e))
+            finally:
+                with self._pending_turns_cond:
+                    remaining = self._pending_turns[session_id] - 1
+                    if remaining:
+                        self._pending_turns[session_id] = remaining
+                    else:
+                        del self._pending_turns[session_id]
+                    self._pending_turns_cond.notify_all()
+    
+    def wait_for_pending_turns(self, session_id: Optional[str] = None,
+                               timeout: Optional[float] = 10.0) -> bool:
+        """
+        Block until queued turns for session_id (or for every session) are written.
+        
+        Returns False if the timeout expired first.
+        """
+        with self._pending_turns_cond:
+            if session_id is None:
+                return self._pending_turns_cond.wait_for(lambda: not self._pending_turns, timeout)
+            return self._pending_turns_cond.wait_for(
+                lambda: session_id not in self._pending_turns, timeout
+            )
+    
+    def flush_pending_turns(self) -> None:
+        """Write out every queued turn (registered with atexit once the writer starts)."""
+        if not self.wait_for_pending_turns(timeout=30.0):
+            session_logger.warning("pending_turns_not_flushed",
+                                   pending_sessions=len(self._pending_turns))
+    
     def load_conversation_history(self, session_id: str, limit: int = 10) -> List[ConversationTurn]:
         """
         Load conversation history with enhanced debugging.
@@ -216,9 +394,18 @@ class SessionManager:
         - Enhanced debugging and error handling
         - Better validation of returned data
         - Detailed logging of what's retrieved
+        - Served from an in-process TTL cache, invalidated on save
         """
         
         session_id = self._sanitize_session_id(session_id)
+        self.wait_for_pending_turns(session_id)
+        cache_key = (session_id, limit)
+        with self._history_lock:
+            cached = self._history_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.HISTORY_CACHE_TTL:
+            session_logger.debug("conversation_history_cache_hit", session_id=session_id, limit=limit)
+            return list(cached[1])
+        
         session_logger.info("loading_conversation_history", 
                           session_id=session_id, 
                           limit=limit)
@@ -242,35 +429,18 @@ class SessionManager:
                     
                     if len(rows) == 0:
                         session_logger.info("no_conversation_history_found", session_id=session_id)
+                        with self._history_lock:
+                            self._history_cache[cache_key] = (time.monotonic(), [])
                         return []
                     
-                    turns = []
-                    for i, row in enumerate(rows):
-                        try:
-                            turn = ConversationTurn(
-                                question=row["question"],
-                                answer=row["answer"],
-                                timestamp=row["timestamp"],
-                                question_type=row["question_type"],
-                                visa_focus=json.loads(row["visa_focus"]) if row["visa_focus"] else None,
-                                tools_used=json.loads(row["tools_used"]) if row["tools_used"] else None
-                            )
-                            turns.append(turn)
-                            session_logger.debug("conversation_turn_loaded", 
-                                               session_id=session_id,
-                                               turn_number=i+1,
-                                               question_preview=turn.question[:50])
-                        except Exception as e:
-                            session_logger.error("conversation_turn_load_failed",
-                                                session_id=session_id,
-                                                turn_number=i+1,
-                                                error_message=str(e))
-                            continue
+                    turns = self._rows_to_turns(session_id, rows)
                     
                     session_logger.info("conversation_history_loaded_successfully", 
                                        session_id=session_id, 
                                        turns_loaded=len(turns))
-                    return turns
+                    with self._history_lock:
+                        self._history_cache[cache_key] = (time.monotonic(), turns)
+                    return list(turns)
                 
         except Exception as e:
             session_logger.error("conversation_history_load_failed",
@@ -279,6 +449,121 @@ class SessionManager:
                                 error_message=str(e))
             return []
     
+    @staticmethod
+    def _rows_to_turns(session_id: str, rows: List[sqlite3.Row]) -> List[ConversationTurn]:
+        """Convert conversation_turns rows to ConversationTurn objects, skipping bad rows."""
+        turns = []
+        for i, row in enumerate(rows):
+            try:
+                turn = ConversationTurn(
+                    question=row["question"],
+                    answer=row["answer"],
+                    timestamp=row["timestamp"],
+                    question_type=row["question_type"],
+                    visa_focus=orjson.loads(row["visa_focus"]) if row["visa_focus"] else None,
+                    tools_used=orjson.loads(row["tools_used"]) if row["tools_used"] else None
+                )
+                turns.append(turn)
+                session_logger.debug("conversation_turn_loaded", 
+                                   session_id=session_id,
+                                   turn_number=i+1,
+                                   question_preview=turn.question[:50])
+            except Exception as e:
+                session_logger.error("conversation_turn_load_failed",
+                                    session_id=session_id,
+                                    turn_number=i+1,
+                                    error_message=str(e))
+                continue
+        return turns
+    
+    def get_session_snapshot(self, session_id: str, limit: int = 10) -> SessionSnapshot:
+        """
+        Load session info and conversation history in one round-trip.
+        
+        Equivalent to calling get_or_create_session and load_conversation_history,
+        but reads everything inside a single connection/transaction instead of
+        opening one per call. The context string is only rendered if the caller
+        asks for it via SessionSnapshot.build_context_string().
+        """
+        
+        session_id = self._sanitize_session_id(session_id)
+        self.wait_for_pending_turns(session_id)
+        now = time.monotonic()
+        with self._history_lock:
+            cached_info = self._session_info_cache.get(session_id)
+            cached_turns = self._history_cache.get((session_id, limit))
+        if (cached_info and cached_turns
+                and now - cached_info[0] < self.HISTORY_CACHE_TTL
+                and now - cached_turns[0] < self.HISTORY_CACHE_TTL):
+            session_logger.debug("session_snapshot_cache_hit", session_id=session_id, limit=limit)
+            return SessionSnapshot(dict(cached_info[1]), list(cached_turns[1]))
+        
+        session_logger.info("loading_session_snapshot", session_id=session_id, limit=limit)
+        
+        try:
+            with PerformanceTimer(session_logger, "session_snapshot_load", session_id=session_id):
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.row_factory = sqlite3.Row
+                    conn.execute("BEGIN")
+                    
+                    session = conn.execute(
+                        "SELECT * FROM sessions WHERE session_id = ?", 
+                        (session_id,)
+                    ).fetchone()
+                    
+                    if session:
+                        session_info = {
+                            "session_id": session["session_id"],
+                            "created_at": session["created_at"],
+                            "updated_at": session["updated_at"],
+                            "turn_count": session["turn_count"],
+                            "session_context": orjson.loads(session["session_context"]) if session["session_context"] else {}
+                        }
+                        # A session with no saved turns yet has nothing to select
+                        rows = conn.execute("""
+                            SELECT * FROM conversation_turns 
+                            WHERE session_id = ? 
+                            ORDER BY turn_number ASC 
+                            LIMIT ?
+                        """, (session_id, limit)).fetchall() if session["turn_count"] else []
+                    else:
+                        session_logger.info("session_not_found_creating_new", session_id=session_id)
+                        conn.execute(
+                            """INSERT INTO sessions (session_id, session_context) 
+                               VALUES (?, ?)""",
+                            (session_id, _EMPTY_JSON_OBJECT)
+                        )
+                        now = datetime.now().isoformat()
+                        session_info = {
+                            "session_id": session_id,
+                            "created_at": now,
+                            "updated_at": now,
+                            "turn_count": 0,
+                            "session_context": {}
+                        }
+                        rows = []
+        
+        except Exception as e:
+            session_logger.error(
+                "session_snapshot_load_failed",
+                session_id=session_id,
+                error_type=type(e).__name__,
+                error_message=str(e),
+                db_path=self.db_path
+            )
+            raise
+        
+        turns = self._rows_to_turns(session_id, rows)
+        with self._history_lock:
+            self._history_cache[(session_id, limit)] = (time.monotonic(), turns)
+            self._session_info_cache[session_id] = (time.monotonic(), session_info)
+        
+        session_logger.info("session_snapshot_loaded", 
+                          session_id=session_id, 
+                          turn_count=session_info["turn_count"],
+                          turns_loaded=len(turns))
+        return SessionSnapshot(dict(session_info), list(turns))
+    
     def get_session_language_preference(self, session_id: str) -> Optional[str]:
         """Get the preferred language for a session with enhanced debugging."""
         session_id = self._sanitize_session_id(session_id)
@@ -306,7 +591,7 @@ class SessionManager:
                 
                 if session_context_raw:
                     try:
-                        context_data = json.loads(session_context_raw)
+                        context_data = orjson.loads(session_context_raw)
                         session_logger.debug("Session context parsed successfully", 
                                             session_id=session_id,
                                             context_keys=list(context_data.keys()))
@@ -419,7 +704,7 @@ class SessionManager:
                 context_data = {}
                 if current_context and current_context[0]:
                     try:
-                        context_data = json.loads(current_context[0])
+                        context_data = orjson.loads(current_context[0])
                         session_logger.debug("Existing context loaded", 
                                            session_id=session_id,
                                            existing_keys=list(context_data.keys()))
@@ -440,13 +725,14 @@ class SessionManager:
                 # Update database
                 rows_updated = conn.execute(
                     "UPDATE sessions SET session_context = ?, updated_at = ? WHERE session_id = ?",
-                    (json.dumps(context_data), datetime.now().isoformat(), session_id)
+                    (_json_text(context_data), datetime.now().isoformat(), session_id)
                 ).rowcount
                 
                 if rows_updated == 0:
                     session_logger.error("Failed to update session context - no rows affected", 
                                        session_id=session_id)
                     return
+                self._invalidate_history_cache(session_id)
                 
                 # Verification: Check if the update worked
                 verify_context = conn.execute(
@@ -456,7 +742,7 @@ class SessionManager:
                 
                 if verify_context and verify_context[0]:
                     try:
-                        verify_data = json.loads(verify_context[0])
+                        verify_data = orjson.loads(verify_context[0])
                         stored_language = verify_data.get("preferred_language")
                         if stored_language == language_code:
                             session_logger.info(
@@ -589,7 +875,7 @@ class SessionManager:
                         conn.execute(
                             """INSERT INTO sessions (session_id, session_context, turn_count) 
                                VALUES (?, ?, ?)""",
-                            (session_id, json.dumps({}), 0)
+                            (session_id, _EMPTY_JSON_OBJECT, 0)
                         )
                         new_turn_number = 1
                     else:
@@ -610,28 +896,30 @@ class SessionManager:
                         turn.answer,
                         turn.timestamp,
                         turn.question_type,
-                        json.dumps(turn.visa_focus) if turn.visa_focus else None,
-                        json.dumps(turn.tools_used) if turn.tools_used else None,
-                        json.dumps(final_state.get("synthesis_metadata", {}))
+                        _json_text(turn.visa_focus) if turn.visa_focus else None,
+                        _json_text(turn.tools_used) if turn.tools_used else None,
+                        _json_text(metadata) if (metadata := final_state.get("synthesis_metadata")) else _EMPTY_JSON_OBJECT
                     ))
                     
                     # Update session context
                     updated_context = self._update_session_context(session_id, final_state, conn)
                     
                     # Update session
+                    updated_at = datetime.now().isoformat()
                     conn.execute("""
                         UPDATE sessions 
                         SET turn_count = ?, updated_at = ?, session_context = ?
                         WHERE session_id = ?
                     """, (
                         new_turn_number,
-                        datetime.now().isoformat(),
-                        json.dumps(updated_context),
+                        updated_at,
+                        _json_text(updated_context),
                         session_id
                     ))
                     
                     # Commit transaction
                     conn.execute("COMMIT")
+                    self._write_through_turn(session_id, turn, new_turn_number, updated_context, updated_at)
                     
                     session_logger.info("conversation_turn_saved_successfully", 
                                        session_id=session_id, 
@@ -671,7 +959,6 @@ class SessionManager:
                                 question_preview=turn.question[:50],
                                 answer_length=len(turn.answer),
                                 correlation_id=correlation_id)
-            import traceback
             session_logger.error("conversation_turn_save_traceback", extra={
                 "event": "conversation_turn_save_traceback",
                 "session_id": session_id,
@@ -714,7 +1001,7 @@ class SessionManager:
             context_data = {}
             if current_context and current_context[0]:
                 try:
-                    context_data = json.loads(current_context[0])
+                    context_data = orjson.loads(current_context[0])
                 except json.JSONDecodeError:
                     session_logger.warning("Invalid JSON in session context", extra={
                         "event": "invalid_session_context_json",
@@ -778,31 +1065,7 @@ class SessionManager:
         try:
             session_info = self.get_or_create_session(session_id)
             conversation_history = self.load_conversation_history(session_id, limit=3)
-            
-            if not conversation_history:
-                return ""
-            
-            context_parts = []
-            context_parts.append("CONVERSATION CONTEXT:")
-            context_parts.append(f"• Session: {session_id}")
-            context_parts.append(f"• Total turns: {session_info['turn_count']}")
-            
-            # Add recent topics
-            context_data = session_info.get("session_context", {})
-            if context_data.get("ongoing_topics"):
-                context_parts.append(f"• Topics discussed: {', '.join(context_data['ongoing_topics'])}")
-            
-            if context_data.get("visa_types_mentioned"):
-                context_parts.append(f"• Visa types mentioned: {', '.join(context_data['visa_types_mentioned'])}")
-            
-            # Add recent conversation
-            if conversation_history:
-                context_parts.append("\nRECENT CONVERSATION:")
-                for i, turn in enumerate(conversation_history[-2:], 1):
-                    context_parts.append(f"Q{i}: {turn.question}")
-                    context_parts.append(f"A{i}: {turn.answer[:200]}...")
-            
-            return "\n".join(context_parts)
+            return self._format_session_context_string(session_id, session_info, conversation_history)
             
         except Exception as e:
             correlation_id = start_request_tracking()
@@ -815,50 +1078,50 @@ class SessionManager:
             })
             return ""
     
+    @staticmethod
+    def _format_session_context_string(session_id: str, session_info: Dict[str, Any],
+                                       conversation_history: List[ConversationTurn]) -> str:
+        """Render the CONVERSATION CONTEXT block from already-loaded session data."""
+        if not conversation_history:
+            return ""
+        
+        context_parts = []
+        context_parts.append("CONVERSATION CONTEXT:")
+        context_parts.append(f"• Session: {session_id}")
+        context_parts.append(f"• Total turns: {session_info['turn_count']}")
+        
+        # Add recent topics
+        context_data = session_info.get("session_context", {})
+        if context_data.get("ongoing_topics"):
+            context_parts.append(f"• Topics discussed: {', '.join(context_data['ongoing_topics'])}")
+        
+        if context_data.get("visa_types_mentioned"):
+            context_parts.append(f"• Visa types mentioned: {', '.join(context_data['visa_types_mentioned'])}")
+        
+        # Add recent conversation
+        if conversation_history:
+            context_parts.append("\nRECENT CONVERSATION:")
+            for i, turn in enumerate(conversation_history[-2:], 1):
+                context_parts.append(f"Q{i}: {turn.question}")
+                context_parts.append(f"A{i}: {turn.answer[:200]}...")
+        
+        return "\n".join(context_parts)
+    
     def detect_followup_question(self, current_question: str, session_context: Dict[str, Any]) -> bool:
         """Enhanced follow-up question detection with better precision."""
         
-        # Strong follow-up indicators
-        # Expanded strong follow-up indicators for better detection
-        strong_followup_indicators = [
-            "it", "that", "this", "what about", "can i also", "and what", "follow up",
-            "additionally", "furthermore", "next step", "after that", "my first", "previous",
-            "earlier", "before", "what did i", "what was", "tell me more", "more details",
-            "can you elaborate", "could you clarify", "expand on", "continue", "go on",
-            "what happened next", "what else", "also", "besides", "in addition", "related to",
-            "regarding that", "regarding this", "about that", "about this", "as mentioned",
-            "as discussed", "as you said", "as you mentioned", "as stated", "as explained"
-        ]
-        
-        # Session reference indicators (very strong)
-        # Expanded session reference indicators for better follow-up detection
-        session_references = [
-            "first", "previous", "earlier", "what did i", "what was", "before", "last",
-            "my last question", "my previous question", "the last answer", "the previous answer",
-            "the last one", "the previous one", "the earlier one", "the earlier question",
-            "the earlier answer", "the answer you gave", "the question before", "the answer before",
-            "the one before", "the one you just answered", "the one you just gave", "the last response",
-            "the previous response", "the earlier response"
-        ]
-        
         question_lower = current_question.lower()
         
         # Check for explicit session references (highest priority)
-        has_session_references = any(word in question_lower for word in session_references)
+        has_session_references = self._SESSION_REFERENCES_RE.search(question_lower) is not None
         
         # Check for strong follow-up words
-        has_strong_followup_words = any(indicator in question_lower for indicator in strong_followup_indicators)
+        has_strong_followup_words = self._FOLLOWUP_INDICATORS_RE.search(question_lower) is not None
         
         # Check question length and immigration terms
-        is_short_question = len(current_question.split()) < 6  # More restrictive
-        # Expanded immigration-related terms for better detection
-        immigration_terms = [
-            "visa", "green card", "citizenship", "naturalization", "h1b", "f1", "opt", "uscis", "immigration",
-            "permanent resident", "work permit", "asylum", "refugee", "i-140", "i-485", "i-20", "ds-160",
-            "eb-1", "eb-2", "eb-3", "l1", "j1", "b2", "e2", "o1", "tn", "daca", "advance parole", "us consulate",
-            "petition", "sponsor", "interview", "status", "application", "case number", "priority date"
-        ]
-        has_immigration_terms = any(term in question_lower for term in immigration_terms)
+        word_count = len(current_question.split())
+        is_short_question = word_count < 6  # More restrictive
+        has_immigration_terms = self._FOLLOWUP_IMMIGRATION_TERMS_RE.search(question_lower) is not None
         
         # IMPROVED LOGIC: More precise detection
         # 1. Explicit session references = definitely follow-up
@@ -887,7 +1150,7 @@ class SessionManager:
                 reason = "no related terms found in context"
             
         # 4. Very short questions without immigration terms = might be follow-up
-        elif is_short_question and not has_immigration_terms and len(current_question.split()) <= 3:
+        elif is_short_question and not has_immigration_terms and word_count <= 3:
             is_followup = True
             reason = "very short non-immigration question"
             
@@ -903,7 +1166,7 @@ class SessionManager:
             "is_followup": is_followup,
             "has_session_references": has_session_references,
             "has_strong_followup_words": has_strong_followup_words,
-            "is_short_question": is_short_question and len(current_question.split()) <= 3,
+            "is_short_question": is_short_question and word_count <= 3,
             "has_immigration_terms": has_immigration_terms,
             "detection_reason": reason,
             "correlation_id": correlation_id
@@ -934,6 +1197,32 @@ class SessionManager:
             })
             return []
 
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Look up one session's summary row by ID without creating it; None if absent."""
+        session_id = self._sanitize_session_id(session_id)
+        self.wait_for_pending_turns(session_id)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                
+                session = conn.execute("""
+                    SELECT session_id, created_at, updated_at, turn_count
+                    FROM sessions
+                    WHERE session_id = ?
+                """, (session_id,)).fetchone()
+                
+                return dict(session) if session else None
+        except Exception as e:
+            correlation_id = start_request_tracking()
+            session_logger.error("Error retrieving session", extra={
+                "event": "session_lookup_error",
+                "session_id": session_id,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "correlation_id": correlation_id
+            })
+            return None
+
     def get_unique_session_ids(self) -> List[str]:
         """
         Returns a list of all unique session IDs in the sessions table.
@@ -953,9 +1242,6 @@ class SessionManager:
             })
             return []
 
-    from typing import List, Dict, Any
-    import sqlite3
-
     def get_answers_by_session(self, session_id: str) -> List[Dict[str, Any]]:
         """
         Return *all* (question, answer) rows for the given session_id.
@@ -969,6 +1255,7 @@ class SessionManager:
 
         Empty list ⇢ no rows found.
         """
+        self.wait_for_pending_turns(session_id)
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row  # map-like rows
@@ -989,10 +1276,52 @@ class SessionManager:
             })
             return []
 
+    # Stay well under SQLite's bound-parameter limit for IN (...) lists
+    _IN_CLAUSE_CHUNK = 500
+
+    def get_answers_by_sessions(self, session_ids: List[str], limit: int = 1000) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return (question, answer) rows for many sessions in one round trip.
+
+        Same rows as calling get_answers_by_session per ID, ordered by turn and
+        capped at the first ``limit`` turns of each session. Sessions without
+        turns map to an empty list.
+        """
+        answers: Dict[str, List[Dict[str, Any]]] = {session_id: [] for session_id in session_ids}
+        for session_id in answers:
+            self.wait_for_pending_turns(session_id)
+        ids = list(answers)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                for start in range(0, len(ids), self._IN_CLAUSE_CHUNK):
+                    chunk = ids[start:start + self._IN_CLAUSE_CHUNK]
+                    rows = conn.execute(
+                        "SELECT session_id, question, answer FROM conversation_turns "
+                        f"WHERE session_id IN ({', '.join('?' * len(chunk))}) "
+                        "ORDER BY session_id, turn_number",
+                        chunk
+                    )
+                    for session_id, question, answer in rows:
+                        session_answers = answers[session_id]
+                        if len(session_answers) < limit:
+                            session_answers.append({"question": question, "answer": answer})
+            return answers
+        except sqlite3.Error as e:
+            correlation_id = start_request_tracking()
+            session_logger.error("Database error getting answers by sessions", extra={
+                "event": "get_answers_batch_db_error",
+                "session_count": len(ids),
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "correlation_id": correlation_id
+            })
+            return {session_id: [] for session_id in ids}
+
     def get_last_answer_by_session(self, session_id: str) -> Optional[str]:
         """
         Retrieves the last answer for a specific session_id.
         """
+        self.wait_for_pending_turns(session_id)
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
@@ -4,7 +4,6 @@ Implements Week 11 requirements with correlation IDs, metrics, and JSON formatti
 """
 
 import logging
-import json
 import uuid
 import time
 from datetime import datetime
@@ -12,6 +11,8 @@ from typing import Dict, Any, Optional
 from contextvars import ContextVar
 import os
 
+import orjson
+
 from backend.code.paths import OUTPUTS_DIR
 
 # Context variable for correlation ID tracking across agents
@@ -43,7 +44,9 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, 'session_id'):
             log_entry["session_id"] = record.session_id
             
-        return json.dumps(log_entry, ensure_ascii=False)
+        # orjson emits UTF-8 directly (what ensure_ascii=False gave us) several times faster;
+        # str() fallback so an odd extra field never drops the record
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 class ImmigrationLogger:
     """Centralized logger for AskImmigrate2.0 with agent-specific context"""
@@ -102,8 +105,14 @@ class ImmigrationLogger:
         """Log debug level with structured extra fields"""
         self._log(logging.DEBUG, message, **kwargs)
     
+    def is_enabled_for(self, level: int) -> bool:
+        """Check the level before building expensive log fields"""
+        return self.logger.isEnabledFor(level)
+    
     def _log(self, level: int, message: str, **kwargs):
         """Internal logging with performance tracking"""
+        if not self.logger.isEnabledFor(level):
+            return
         extra = {"extra_fields": kwargs}
         
         # Add session context if available
@@ -153,8 +162,10 @@ def get_logger(agent_name: str) -> ImmigrationLogger:
 manager_logger = get_logger("manager")
 synthesis_logger = get_logger("synthesis") 
 reviewer_logger = get_logger("reviewer")
+fast_answer_logger = get_logger("fast_answer")
 workflow_logger = get_logger("workflow")
 api_logger = get_logger("api")
+performance_logger = get_logger("performance")
 cli_logger = get_logger("cli")
 
 # Helper function to initialize correlation ID for new requests
@@ -114,17 +114,11 @@ class TestAPIModule:
             {"session_id": "abc12345-test-session-3"}
         ]
         
-        # Mock conversation history
-        from backend.code.session_manager import ConversationTurn
-        from datetime import datetime
-        
-        mock_session_manager.load_conversation_history.return_value = [
-            ConversationTurn(
-                question="What is H-1B?", 
-                answer="H-1B is a work visa",
-                timestamp=datetime.now().isoformat()
-            )
-        ]
+        # Mock batched Q&A lookup
+        mock_session_manager.get_answers_by_sessions.side_effect = lambda session_ids, limit: {
+            session_id: [{"question": "What is H-1B?", "answer": "H-1B is a work visa"}]
+            for session_id in session_ids
+        }
         
         # Mock fingerprint functions
         mock_hash.return_value = "abc12345"
@@ -137,6 +131,10 @@ class TestAPIModule:
         data = response.json()
         assert len(data) == 2  # Should return 2 sessions with matching fingerprint
         assert all(session["session_id"].startswith("abc12345") for session in data)
+        assert data[0]["questions"] == ["What is H-1B?"]
+        mock_session_manager.get_answers_by_sessions.assert_called_once_with(
+            ["abc12345-test-session-1", "abc12345-test-session-3"], limit=1000
+        )
 
     def test_get_session_qa_no_fingerprint(self, client):
         """Test 6: GET /session-qa without client fingerprint (security)"""
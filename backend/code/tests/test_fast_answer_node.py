@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Fast Answer Node Tests
+Purpose: Cover the single-call manager+synthesis path for simple questions
+
+1. Entry routing - simple first questions only, and only when enabled
+2. Exit routing - review the answer, reject to synthesis, or fall back to the manager
+3. Node - one structured LLM call fills analysis and synthesis together (sync and async)
+4. Fallbacks - fee questions and unsupported languages go through the full flow
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Setup paths
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+ENGLISH = {"language": "en", "language_name": "English", "confidence": 0.9, "supported": True}
+
+
+def test_route_from_start_picks_fast_answer_for_simple_first_question():
+    """Test 1: A short standalone question takes the fast answer path"""
+    from backend.code.agent_nodes import fast_answer_node
+
+    with patch.object(fast_answer_node, "COMBINED_FAST_ANSWER", True):
+        assert fast_answer_node.route_from_start({"text": "What is an H-1B visa?"}) == "fast_answer"
+        assert fast_answer_node.route_from_start({"text": "Compare H-1B and O-1 for my startup"}) == "manager"
+
+
+def test_route_from_start_keeps_follow_ups_and_disabled_config_on_manager():
+    """Test 2: Follow-ups need the manager's session awareness; config can disable the path"""
+    from backend.code.agent_nodes import fast_answer_node
+
+    follow_up = {"text": "What is it?", "conversation_history": [Mock()]}
+    with patch.object(fast_answer_node, "COMBINED_FAST_ANSWER", True):
+        assert fast_answer_node.route_from_start(follow_up) == "manager"
+    with patch.object(fast_answer_node, "COMBINED_FAST_ANSWER", False):
+        assert fast_answer_node.route_from_start({"text": "What is an H-1B visa?"}) == "manager"
+
+
+def test_route_from_start_sends_fee_questions_to_manager():
+    """Test 2b: Fee questions need fee_calculator_tool, which only the manager flow runs"""
+    from backend.code.agent_nodes import fast_answer_node
+
+    with patch.object(fast_answer_node, "COMBINED_FAST_ANSWER", True):
+        assert fast_answer_node.route_from_start({"text": "How much is the H-1B fee?"}) == "manager"
+        assert fast_answer_node.route_from_start({"text": "What is the I-485 cost?"}) == "manager"
+
+
+def test_route_from_fast_answer():
+    """Test 3: Review a fast answer, send rejected input to synthesis, otherwise fall back"""
+    from backend.code.agent_nodes.fast_answer_node import route_from_fast_answer
+
+    assert route_from_fast_answer({"synthesis": "An H-1B is a work visa."}) == "reviewer"
+    assert route_from_fast_answer({"structured_analysis": {"question_type": "validation_error"}}) == "synthesizer"
+    assert route_from_fast_answer({"synthesis": ""}) == "manager"
+
+
+def test_fast_answer_node_fills_analysis_and_synthesis():
+    """Test 4: One structured call produces both the analysis and the answer"""
+    from backend.code.agent_nodes import fast_answer_node
+    from backend.code.agentic_state import CombinedResponse
+
+    structured_llm = Mock()
+    structured_llm.invoke.return_value = CombinedResponse(
+        question_type="visa_definition",
+        primary_focus="H-1B basics",
+        visa_focus=["H-1B"],
+        synthesis="The H-1B is a temporary work visa for specialty occupations.",
+    )
+    llm = Mock()
+    llm.with_structured_output.return_value = structured_llm
+
+    state = {"text": "What is an H-1B visa?", "session_id": "fast-1"}
+    with patch.object(fast_answer_node, "get_llm", return_value=llm), \
+         patch.object(fast_answer_node, "detect_and_validate_language", return_value=ENGLISH), \
+         patch.object(fast_answer_node, "_retrieve_context", return_value="H-1B context"):
+        result = fast_answer_node.fast_answer_node(state)
+
+    assert structured_llm.invoke.call_count == 1
+    assert result["synthesis"].startswith("The H-1B")
+    assert result["structured_analysis"]["visa_focus"] == ["H-1B"]
+    assert result["workflow_parameters"] is result["structured_analysis"]
+
+
+def test_fast_answer_node_returns_empty_update_on_llm_failure():
+    """Test 5: LLM errors leave synthesis unset so routing falls back to the manager"""
+    from backend.code.agent_nodes import fast_answer_node
+
+    llm = Mock()
+    llm.with_structured_output.return_value.invoke.side_effect = RuntimeError("quota")
+
+    with patch.object(fast_answer_node, "get_llm", return_value=llm), \
+         patch.object(fast_answer_node, "detect_and_validate_language", return_value=ENGLISH), \
+         patch.object(fast_answer_node, "_retrieve_context", return_value=""):
+        result = fast_answer_node.fast_answer_node({"text": "What is an H-1B visa?", "session_id": "fast-2"})
+
+    assert result == {}
+
+
+def test_async_fast_answer_node_awaits_llm():
+    """Test 6: The async variant awaits ainvoke instead of blocking on invoke"""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from backend.code.agent_nodes import fast_answer_node
+    from backend.code.agentic_state import CombinedResponse
+
+    llm = Mock()
+    structured_llm = llm.with_structured_output.return_value
+    structured_llm.ainvoke = AsyncMock(return_value=CombinedResponse(
+        question_type="visa_definition",
+        primary_focus="F-1 basics",
+        visa_focus=["F-1"],
+        synthesis="The F-1 is a nonimmigrant student visa for academic study.",
+    ))
+
+    with patch.object(fast_answer_node, "get_llm", return_value=llm), \
+         patch.object(fast_answer_node, "detect_and_validate_language", return_value=ENGLISH), \
+         patch.object(fast_answer_node, "_retrieve_context", return_value=""):
+        result = asyncio.run(fast_answer_node.afast_answer_node({"text": "What is an F-1 visa?", "session_id": "fast-3"}))
+
+    structured_llm.ainvoke.assert_awaited_once()
+    structured_llm.invoke.assert_not_called()
+    assert result["structured_analysis"]["visa_focus"] == ["F-1"]
+
+
+def test_fast_answer_node_falls_back_on_unsupported_language():
+    """Test 7: Unsupported languages skip the LLM call so synthesis sends its standard reply"""
+    from backend.code.agent_nodes import fast_answer_node
+
+    unsupported = {"language": "de", "language_name": "DE", "confidence": 0.9, "supported": False}
+    with patch.object(fast_answer_node, "get_llm") as mock_get_llm, \
+         patch.object(fast_answer_node, "detect_and_validate_language", return_value=unsupported), \
+         patch.object(fast_answer_node, "_retrieve_context", return_value=""):
+        result = fast_answer_node.fast_answer_node({"text": "Was ist ein H-1B Visum?", "session_id": "fast-4"})
+
+    assert result == {}
+    assert fast_answer_node.route_from_fast_answer(result) == "manager"
+    mock_get_llm.assert_not_called()
@@ -54,7 +54,7 @@ def analyze_empty_session():
         print(f"   Ongoing Topics: {session_context.ongoing_topics}")
         print(f"   Visa Types Mentioned: {session_context.visa_types_mentioned}")
         print(f"   User Situation: {session_context.user_situation}")
-        print(f"   Previous Questions Summary: {session_context.previous_questions_summary}")
+        print(f"   Previous Questions Summary: {session_context.get_previous_questions_summary()}")
     
     return state, session_id
 
@@ -130,7 +130,7 @@ def analyze_session_with_history():
         print(f"   Ongoing Topics: {session_context.ongoing_topics}")
         print(f"   Visa Types Mentioned: {session_context.visa_types_mentioned}")
         print(f"   User Situation: {session_context.user_situation}")
-        print(f"   Previous Questions Summary: {session_context.previous_questions_summary}")
+        print(f"   Previous Questions Summary: {session_context.get_previous_questions_summary()}")
     
     return state, session_id
 
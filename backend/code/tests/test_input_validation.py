@@ -46,8 +46,8 @@ class TestInputValidatorCore:
         assert isinstance(validator, InputValidator)
         assert validator.MAX_QUERY_LENGTH == 5000
         assert validator.MIN_QUERY_LENGTH == 3
-        assert len(validator.compiled_injection_patterns) > 0
-        assert len(validator.compiled_sql_patterns) > 0
+        assert validator.injection_re.search("<script>alert(1)</script>")
+        assert validator.sql_re.search("1; DROP TABLE sessions")
     
     @pytest.mark.unit
     @pytest.mark.security
@@ -134,7 +134,9 @@ class TestSecurityValidation:
             "<object data='javascript:alert(1)'></object>",
             "<embed src='javascript:alert(1)'></embed>",
             "What is H-1B? <script>steal_data()</script>",
-            "onclick=alert('xss') Tell me about green cards"
+            "onclick=alert('xss') Tell me about green cards",
+            "<script src='https://evil.example/x.js'",  # unclosed tag
+            "<style>body{display:none}"
         ]
         
         for xss_attempt in xss_attempts:
@@ -368,7 +370,7 @@ class TestRateLimiting:
     
     @pytest.mark.unit
     @pytest.mark.security
-    @patch('time.time')
+    @patch('time.monotonic')
     def test_rate_limiting_time_window_reset(self, mock_time):
         """Test that rate limiting resets after time window."""
         limiter = RateLimiter(max_requests_per_minute=2)
@@ -481,14 +483,14 @@ class TestEdgeCases:
             query = "How do I apply for H-1B status?"
             result = validator.validate_query(query, "test-session-logging")
             
-            # Verify logging calls were made
-            mock_logger.info.assert_any_call(
+            # Clean queries log at DEBUG only
+            mock_logger.debug.assert_any_call(
                 "input_validation_started",
                 original_length=len(query),
                 session_id="test-session-logging"
             )
             
-            mock_logger.info.assert_any_call(
+            mock_logger.debug.assert_any_call(
                 "input_validation_completed",
                 is_valid=result.is_valid,
                 sanitized_length=len(result.sanitized_input),
@@ -496,6 +498,20 @@ class TestEdgeCases:
                 errors_count=len(result.errors),
                 session_id="test-session-logging"
             )
+            mock_logger.info.assert_not_called()
+    
+    @pytest.mark.unit
+    @pytest.mark.security
+    def test_rejected_query_logged_at_info(self):
+        """Test that rejected queries still reach INFO-level logs."""
+        validator = InputValidator()
+        
+        with patch('input_validation.manager_logger') as mock_logger:
+            result = validator.validate_query("<script>alert(1)</script>", "test-session-logging")
+        
+        assert result.is_valid == False
+        assert mock_logger.info.call_args.args == ("input_validation_completed",)
+        assert mock_logger.info.call_args.kwargs["errors_count"] == len(result.errors)
 
 class TestPerformance:
     """Test performance characteristics of validation."""
@@ -518,6 +534,24 @@ class TestPerformance:
         assert (end_time - start_time) < 1.0
         assert isinstance(result, ValidationResult)
     
+    @pytest.mark.unit
+    @pytest.mark.security
+    @pytest.mark.performance
+    def test_repeated_query_served_from_analysis_cache(self):
+        """Test that repeating a query reuses the cached checks but returns fresh lists."""
+        validator = InputValidator()
+        query = "What is <b>an</b> H-1B visa?"
+        
+        first = validator.validate_query(query, "test-session-cache")
+        with patch.object(validator, "_sanitize_input") as mock_sanitize:
+            second = validator.validate_query(query, "test-session-cache")
+        
+        mock_sanitize.assert_not_called()
+        assert second == first
+        # Callers may mutate their result without touching the cached entry
+        second.errors.append("caller-added")
+        assert "caller-added" not in validator.validate_query(query, "test-session-cache").errors
+    
     @pytest.mark.unit
     @pytest.mark.security
     @pytest.mark.performance
@@ -562,6 +562,35 @@ def test_build_session_aware_prompt_without_history():
     # Should just contain the base prompt
     assert len(prompt) > 0
 
+def test_session_aware_messages_keep_system_prefix_stable():
+    """Prompt Building - System message must not change between turns"""
+    from backend.code.agentic_state import ImmigrationState
+    from backend.code.agent_nodes.manager_node import build_session_aware_messages
+    from backend.code.session_manager import ConversationTurn
+    from datetime import datetime
+
+    first_turn = ImmigrationState(text="What is an H-1B visa?", session_id="test-prefix")
+    second_turn = ImmigrationState(
+        text="Can I extend it?",
+        session_id="test-prefix",
+        conversation_history=[
+            ConversationTurn(
+                question="What is an H-1B visa?",
+                answer="H-1B is a work visa...",
+                timestamp=datetime.now().isoformat()
+            )
+        ]
+    )
+
+    first = build_session_aware_messages("What is an H-1B visa?", first_turn)
+    second = build_session_aware_messages("Can I extend it?", second_turn)
+
+    # Static instructions are byte-identical, per-turn content lives in the human message
+    assert first[0].content == second[0].content
+    assert "Can I extend it?" not in second[0].content
+    assert "Q1: What is an H-1B visa?" in second[1].content
+    assert "NEW QUESTION: Can I extend it?" in second[1].content
+
 def test_comprehensive_coverage_verification():
     """Test 19: Comprehensive verification of all missing lines covered"""
     
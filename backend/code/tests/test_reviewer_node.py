@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Reviewer Node Tests
+Purpose: Cover when the reviewer calls the LLM and how its verdict becomes state
+
+1. Past the revision limit - approval without an LLM call
+2. Within the limit - the LLM verdict drives needs_revision (sync and async)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Setup paths
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+def _review(**approvals):
+    from backend.code.agentic_state import ReviewOutput
+
+    fields = {"rag_retriever_approved": True, "synthesis_approved": True, "references_approved": True}
+    fields.update(approvals)
+    return ReviewOutput(
+        rag_retriever_feedback="ok",
+        synthesis_feedback="ok",
+        references_feedback="ok",
+        **fields,
+    )
+
+
+def test_final_round_approves_without_llm_call():
+    """Test 1: The draft after the last allowed revision is approved without a review call"""
+    from backend.code.agent_nodes import reviewer_node
+
+    with patch.object(reviewer_node, "get_llm") as mock_get_llm:
+        result = reviewer_node.reviewer_node(
+            {"text": "What is an H-1B?", "revision_round": reviewer_node.MAX_REVISIONS}
+        )
+
+    mock_get_llm.assert_not_called()
+    assert result["needs_revision"] is False
+    assert result["revision_round"] == reviewer_node.MAX_REVISIONS + 1
+    assert result["synthesis_approved"] is True
+
+
+def test_earlier_round_uses_llm_verdict():
+    """Test 2: The first review is real - a rejection routes back to synthesis"""
+    from backend.code.agent_nodes import reviewer_node
+
+    llm = Mock()
+    llm.with_structured_output.return_value.invoke.return_value = _review(synthesis_approved=False)
+
+    with patch.object(reviewer_node, "get_llm", return_value=llm):
+        result = reviewer_node.reviewer_node({"text": "What is an H-1B?", "revision_round": 0})
+
+    assert result["needs_revision"] is True
+    assert result["synthesis_approved"] is False
+    assert reviewer_node.route_from_reviewer(result) == "synthesizer"
+
+
+def test_async_reviewer_awaits_llm():
+    """Test 3: The async variant awaits ainvoke within the revision limit"""
+    from backend.code.agent_nodes import reviewer_node
+
+    llm = Mock()
+    structured_llm = llm.with_structured_output.return_value
+    structured_llm.ainvoke = AsyncMock(return_value=_review())
+
+    with patch.object(reviewer_node, "get_llm", return_value=llm):
+        result = asyncio.run(reviewer_node.areviewer_node({"text": "What is an H-1B?", "revision_round": 0}))
+
+    structured_llm.ainvoke.assert_awaited_once()
+    assert result["needs_revision"] is False
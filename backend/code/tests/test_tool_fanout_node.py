@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tool Fan-out Node Tests
+Purpose: Cover the Send-based parallel tool dispatch between manager and synthesis
+
+1. Dispatch - one Send per recommended tool that has no usable result yet
+2. Skipping - straight to synthesis when everything is prefetched or disabled
+3. Worker - single tool execution merged through the tool_results reducer
+4. Synthesis - tools the fan-out attempted are reused, never run again
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Setup paths
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+MANAGER_DECISION = (
+    "TOOL_RECOMMENDATIONS:\n"
+    "- Required_Tools: [web_search_tool, fee_calculator_tool]\n"
+)
+
+
+def test_dispatch_sends_only_pending_tools():
+    """Test 1: Tools with a successful prefetched result are not dispatched again"""
+    from backend.code.agent_nodes import tool_fanout_node
+
+    state = {
+        "text": "How much is the H-1B fee?",
+        "session_id": "s1",
+        "manager_decision": MANAGER_DECISION,
+        "tool_results": {"web_search_tool": "already fetched"},
+    }
+    with patch.object(tool_fanout_node, "PARALLEL_TOOL_EXECUTION", True):
+        sends = tool_fanout_node.dispatch_recommended_tools(state)
+
+    assert [send.node for send in sends] == ["tool_worker"]
+    assert sends[0].arg == {
+        "tool_name": "fee_calculator_tool",
+        "text": "How much is the H-1B fee?",
+        "session_id": "s1",
+    }
+
+
+def test_dispatch_retries_errored_prefetched_tools():
+    """Test 2: An error result from the manager does not count as prefetched"""
+    from backend.code.agent_nodes import tool_fanout_node
+
+    state = {
+        "text": "fee",
+        "manager_decision": MANAGER_DECISION,
+        "tool_results": {"web_search_tool": {"error": "timeout"}, "fee_calculator_tool": "ok"},
+    }
+    with patch.object(tool_fanout_node, "PARALLEL_TOOL_EXECUTION", True):
+        sends = tool_fanout_node.dispatch_recommended_tools(state)
+
+    assert [send.arg["tool_name"] for send in sends] == ["web_search_tool"]
+
+
+def test_dispatch_goes_to_synthesizer_when_nothing_pending_or_disabled():
+    """Test 3: No fan-out when all tools are prefetched or the feature flag is off"""
+    from backend.code.agent_nodes import tool_fanout_node
+
+    state = {
+        "text": "fee",
+        "manager_decision": MANAGER_DECISION,
+        "tool_results": {"web_search_tool": "a", "fee_calculator_tool": "b"},
+    }
+    with patch.object(tool_fanout_node, "PARALLEL_TOOL_EXECUTION", True):
+        assert tool_fanout_node.dispatch_recommended_tools(state) == "synthesizer"
+
+    state["tool_results"] = {}
+    with patch.object(tool_fanout_node, "PARALLEL_TOOL_EXECUTION", False):
+        assert tool_fanout_node.dispatch_recommended_tools(state) == "synthesizer"
+
+
+def test_tool_worker_runs_single_tool():
+    """Test 4: Worker returns only its own tool's result for the reducer to merge"""
+    from backend.code.agent_nodes import tool_fanout_node
+    from backend.code.agentic_state import merge_tool_results
+
+    tool = Mock()
+    tool.name = "fee_calculator_tool"
+    tool.invoke.return_value = "$780"
+
+    with patch.object(tool_fanout_node, "get_tools_by_agent", return_value=[tool]):
+        update = tool_fanout_node.tool_worker_node(
+            {"tool_name": "fee_calculator_tool", "text": "fee", "session_id": "s1"}
+        )
+        missing = tool_fanout_node.tool_worker_node(
+            {"tool_name": "unknown_tool", "text": "fee", "session_id": "s1"}
+        )
+
+    assert update == {
+        "tool_results": {"fee_calculator_tool": "$780"},
+        "fanout_tools_attempted": ["fee_calculator_tool"],
+    }
+    assert missing == {"fanout_tools_attempted": ["unknown_tool"]}
+    tool.invoke.assert_called_once_with({"query": "fee"})
+    assert merge_tool_results({"rag_retrieval_tool": "r"}, update["tool_results"]) == {
+        "rag_retrieval_tool": "r",
+        "fee_calculator_tool": "$780",
+    }
+
+
+def test_synthesis_reuses_fanout_attempts_including_errors():
+    """Test 5: An errored fan-out result is kept for synthesis instead of re-running the tool"""
+    from backend.code.agent_nodes import synthesis_node
+
+    web_search = Mock()
+    web_search.name = "web_search_tool"
+    fee_calculator = Mock()
+    fee_calculator.name = "fee_calculator_tool"
+
+    with patch.object(synthesis_node, "get_tools_by_agent", return_value=[web_search, fee_calculator]):
+        tool_results, tools_used = synthesis_node.execute_manager_recommended_tools(
+            MANAGER_DECISION, "fee", "s1",
+            prefetched={"web_search_tool": {"error": "timeout"}, "fee_calculator_tool": "$780"},
+            attempted=["web_search_tool", "fee_calculator_tool"],
+        )
+
+    web_search.invoke.assert_not_called()
+    fee_calculator.invoke.assert_not_called()
+    assert tool_results == {"web_search_tool": {"error": "timeout"}, "fee_calculator_tool": "$780"}
+    assert tools_used == ["fee_calculator_tool"]
@@ -55,7 +55,7 @@ class TestToolRegistryModule:
     def test_get_tools_by_agent_manager(self):
         """Test 3: Manager agent gets only RAG tool"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             tools = get_tools_by_agent("manager")
@@ -64,16 +64,17 @@ class TestToolRegistryModule:
             assert len(tools) == 1
             assert tools[0].name == "rag_retrieval_tool"
             
-            # Verify print was called with correct message
-            mock_print.assert_called_once()
-            call_args = mock_print.call_args[0][0]
-            assert "Agent 'manager' has access to 1 tools" in call_args
-            assert "rag_retrieval_tool" in call_args
+            # Verify the debug record lists the agent's tools
+            mock_logger.debug.assert_called_once()
+            call_kwargs = mock_logger.debug.call_args.kwargs
+            assert call_kwargs["agent"] == "manager"
+            assert len(call_kwargs["tools"]) == 1
+            assert "rag_retrieval_tool" in call_kwargs["tools"]
 
     def test_get_tools_by_agent_synthesis(self):
         """Test 4: Synthesis agent gets all tools"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             tools = get_tools_by_agent("synthesis")
@@ -85,15 +86,16 @@ class TestToolRegistryModule:
             for expected_tool in expected_tools:
                 assert expected_tool in tool_names
             
-            # Verify print was called with correct message
-            mock_print.assert_called_once()
-            call_args = mock_print.call_args[0][0]
-            assert "Agent 'synthesis' has access to 3 tools" in call_args
+            # Verify the debug record lists the agent's tools
+            mock_logger.debug.assert_called_once()
+            call_kwargs = mock_logger.debug.call_args.kwargs
+            assert call_kwargs["agent"] == "synthesis"
+            assert len(call_kwargs["tools"]) == 3
 
     def test_get_tools_by_agent_reviewer(self):
         """Test 5: Reviewer agent gets fee calculator and web search tools"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             tools = get_tools_by_agent("reviewer")
@@ -108,15 +110,16 @@ class TestToolRegistryModule:
             # Verify RAG tool is not included
             assert "rag_retrieval_tool" not in tool_names
             
-            # Verify print was called with correct message
-            mock_print.assert_called_once()
-            call_args = mock_print.call_args[0][0]
-            assert "Agent 'reviewer' has access to 2 tools" in call_args
+            # Verify the debug record lists the agent's tools
+            mock_logger.debug.assert_called_once()
+            call_kwargs = mock_logger.debug.call_args.kwargs
+            assert call_kwargs["agent"] == "reviewer"
+            assert len(call_kwargs["tools"]) == 2
 
     def test_get_tools_by_agent_unknown_agent(self):
         """Test 6: Unknown agent gets empty list"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             tools = get_tools_by_agent("unknown_agent")
@@ -125,15 +128,16 @@ class TestToolRegistryModule:
             assert len(tools) == 0
             assert tools == []
             
-            # Verify print was called with correct message
-            mock_print.assert_called_once()
-            call_args = mock_print.call_args[0][0]
-            assert "Agent 'unknown_agent' has access to 0 tools" in call_args
+            # Verify the debug record lists the agent's tools
+            mock_logger.debug.assert_called_once()
+            call_kwargs = mock_logger.debug.call_args.kwargs
+            assert call_kwargs["agent"] == "unknown_agent"
+            assert len(call_kwargs["tools"]) == 0
 
     def test_get_tools_by_agent_empty_string(self):
         """Test 7: Empty string agent name returns empty list"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             tools = get_tools_by_agent("")
@@ -142,13 +146,13 @@ class TestToolRegistryModule:
             assert len(tools) == 0
             assert tools == []
             
-            # Verify print was called
-            mock_print.assert_called_once()
+            # Verify the debug record was emitted
+            mock_logger.debug.assert_called_once()
 
     def test_get_tools_by_agent_case_sensitivity(self):
         """Test 8: Agent names are case sensitive"""
         
-        with patch('builtins.print') as mock_print:
+        with patch('backend.code.tools.tool_registry.tool_logger') as mock_logger:
             from backend.code.tools.tool_registry import get_tools_by_agent
             
             # Test different cases
@@ -172,7 +176,7 @@ class TestToolRegistryModule:
         }
         
         for agent_name, expected_count in agent_configs.items():
-            with patch('builtins.print'):
+            with patch('backend.code.tools.tool_registry.tool_logger'):
                 tools = get_tools_by_agent(agent_name)
                 assert len(tools) == expected_count, f"Agent {agent_name} should have {expected_count} tools, got {len(tools)}"
 
@@ -209,7 +213,7 @@ class TestToolRegistryModule:
         agents = ["manager", "synthesis", "reviewer"]
         
         for agent in agents:
-            with patch('builtins.print'):
+            with patch('backend.code.tools.tool_registry.tool_logger'):
                 agent_tools = get_tools_by_agent(agent)
                 agent_tool_names.update(tool.name for tool in agent_tools)
         
@@ -233,7 +237,7 @@ class TestToolRegistryModule:
             assert isinstance(tool, BaseTool)
         
         # Test get_tools_by_agent return type
-        with patch('builtins.print'):
+        with patch('backend.code.tools.tool_registry.tool_logger'):
             agent_tools = get_tools_by_agent("manager")
             assert isinstance(agent_tools, list)
             for tool in agent_tools:
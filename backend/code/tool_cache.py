@@ -3,24 +3,28 @@ Tool result caching for improved performance across agent calls.
 """
 import time
 import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from backend.code.utils import load_config
+from backend.code.utils import load_yaml_config
 from backend.code.paths import APP_CONFIG_FPATH
 
-# Global cache for tool results
-_tool_cache = {}
+# Global cache for tool results, least recently used first
+_tool_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+MAX_CACHED_TOOL_RESULTS = 100
 
 def get_cache_key(tool_name: str, args: Dict[str, Any]) -> str:
     """Generate a cache key for tool results."""
     # Create a deterministic key from tool name and arguments
     args_str = str(sorted(args.items()))
     combined = f"{tool_name}:{args_str}"
-    return hashlib.md5(combined.encode()).hexdigest()
+    # In-process key only, so a fast non-cryptographic-use digest is fine
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
 
 def get_cached_tool_result(tool_name: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Get cached tool result if available and not expired."""
     try:
-        config = load_config(APP_CONFIG_FPATH)
+        # Parsed once per process; re-reading the YAML cost more than most lookups
+        config = load_yaml_config(APP_CONFIG_FPATH)
         if not config.get("performance", {}).get("enable_tool_caching", False):
             return None
         
@@ -32,6 +36,7 @@ def get_cached_tool_result(tool_name: str, args: Dict[str, Any]) -> Optional[Dic
             
             # Check if cache is still valid
             if time.time() - cached_item["timestamp"] < cache_ttl:
+                _tool_cache.move_to_end(cache_key)
                 return cached_item["result"]
             else:
                 # Remove expired cache entry
@@ -45,7 +50,7 @@ def get_cached_tool_result(tool_name: str, args: Dict[str, Any]) -> Optional[Dic
 def cache_tool_result(tool_name: str, args: Dict[str, Any], result: Dict[str, Any]) -> None:
     """Cache tool result for future use."""
     try:
-        config = load_config(APP_CONFIG_FPATH)
+        config = load_yaml_config(APP_CONFIG_FPATH)
         if not config.get("performance", {}).get("enable_tool_caching", False):
             return
         
@@ -54,13 +59,11 @@ def cache_tool_result(tool_name: str, args: Dict[str, Any], result: Dict[str, An
             "result": result,
             "timestamp": time.time()
         }
+        _tool_cache.move_to_end(cache_key)
         
-        # Basic cache cleanup - remove old entries if cache gets too large
-        if len(_tool_cache) > 100:
-            # Remove oldest 20 entries
-            sorted_items = sorted(_tool_cache.items(), key=lambda x: x[1]["timestamp"])
-            for key, _ in sorted_items[:20]:
-                del _tool_cache[key]
+        # Evict least recently used entries once the cache is full
+        while len(_tool_cache) > MAX_CACHED_TOOL_RESULTS:
+            _tool_cache.popitem(last=False)
                 
     except Exception:
         # If caching fails, continue without caching
@@ -68,5 +71,4 @@ def cache_tool_result(tool_name: str, args: Dict[str, Any], result: Dict[str, An
 
 def clear_tool_cache() -> None:
     """Clear all cached tool results."""
-    global _tool_cache
-    _tool_cache = {}
+    _tool_cache.clear()
@@ -99,32 +99,39 @@ def parse_fee_query(query: str) -> Dict[str, Any]:
     }
 
 
+# Procedure keywords; when several procedures match, the earlier entry wins
+PROCEDURE_PATTERNS = {
+    "naturalization": ["natural", "citizen", "n-400", "citizenship"],
+    "green_card": ["green card", "permanent resident", "i-485", "adjustment of status"],
+    "h1b": ["h-1b", "h1b", "work visa", "specialty occupation"],
+    "opt": ["opt", "optional practical training", "i-765"],
+    "f1": ["f-1", "f1", "student visa"],
+    "asylum": ["asylum", "i-589", "refugee"],
+    "family_petition": ["i-130", "family petition", "relative petition"],
+    "k1_fiance": ["k-1", "k1", "fiance", "fiancé"],
+    "tourist_visit": ["b-1", "b-2", "tourist", "visitor"],
+    "extension": ["extend", "extension", "i-539"],
+    "removal_defense": ["removal", "deportation", "immigration court"]
+}
+_PROCEDURE_PRIORITY = {procedure: rank for rank, procedure in enumerate(PROCEDURE_PATTERNS)}
+# One named group per procedure inside a lookahead, so a single finditer pass
+# reports every keyword occurrence (overlapping ones included) by procedure
+_PROCEDURE_RE = re.compile("(?=(?:" + "|".join(
+    f"(?P<{procedure}>{'|'.join(map(re.escape, keywords))})"
+    for procedure, keywords in PROCEDURE_PATTERNS.items()
+) + "))")
+
+
 def extract_procedure_type(query: str) -> str:
     """Extract the type of immigration procedure from query."""
-    
-    procedure_patterns = {
-        "naturalization": ["natural", "citizen", "n-400", "citizenship"],
-        "green_card": ["green card", "permanent resident", "i-485", "adjustment of status"],
-        "h1b": ["h-1b", "h1b", "work visa", "specialty occupation"],
-        "opt": ["opt", "optional practical training", "i-765"],
-        "f1": ["f-1", "f1", "student visa"],
-        "asylum": ["asylum", "i-589", "refugee"],
-        "family_petition": ["i-130", "family petition", "relative petition"],
-        "k1_fiance": ["k-1", "k1", "fiance", "fiancé"],
-        "tourist_visit": ["b-1", "b-2", "tourist", "visitor"],
-        "extension": ["extend", "extension", "i-539"],
-        "removal_defense": ["removal", "deportation", "immigration court"]
-    }
-    
-    for procedure, keywords in procedure_patterns.items():
-        if any(keyword in query for keyword in keywords):
-            return procedure
-    
-    return "unknown_procedure"
+    matched = {match.lastgroup for match in _PROCEDURE_RE.finditer(query)}
+    if not matched:
+        return "unknown_procedure"
+    return min(matched, key=_PROCEDURE_PRIORITY.__getitem__)
 
 
 def extract_applicant_info(query: str) -> Dict[str, Any]:
-    """Extract information about number and types of applicants."""
+    """Extract information about number and types of applicants from an already-lowercased query."""
     
     applicants = {
         "adults": 0,
@@ -176,7 +183,7 @@ def extract_applicant_info(query: str) -> Dict[str, Any]:
     ]
     
     for pattern in company_patterns:
-        match = re.search(pattern, query.lower())
+        match = re.search(pattern, query)
         if match:
             applicants["is_company"] = True
             if match.groups():
@@ -188,19 +195,19 @@ def extract_applicant_info(query: str) -> Dict[str, Any]:
     
     # Military status
     military_terms = ["military", "veteran", "active duty", "armed forces", "service member"]
-    if any(term in query.lower() for term in military_terms):
+    if any(term in query for term in military_terms):
         applicants["military_status"] = True
     
     # Low income status
     income_terms = ["low income", "financial hardship", "cannot afford", "fee waiver", "poverty"]
-    if any(term in query.lower() for term in income_terms):
+    if any(term in query for term in income_terms):
         applicants["low_income"] = True
     
     # Dependent detection
     dependent_terms = ["dependent", "beneficiary"]
-    if any(term in query.lower() for term in dependent_terms):
+    if any(term in query for term in dependent_terms):
         # Look for numbers before "dependent"
-        dep_match = re.search(r"(\d+)\s*dependents?", query.lower())
+        dep_match = re.search(r"(\d+)\s*dependents?", query)
         if dep_match:
             applicants["dependents"] = int(dep_match.group(1))
         else:
@@ -228,9 +235,12 @@ def extract_applicant_info(query: str) -> Dict[str, Any]:
     return applicants
 
 
+# Dollar amounts like "$1,440" in search snippets
+_FEE_AMOUNT_RE = re.compile(r'\$(\d+(?:,\d{3})*)')
+
+
 def parse_fees_from_results(results: List[Dict[str, Any]], proc_type: str, form_number: str) -> Dict[str, Any]:
     """Parse fee information from web search results."""
-    import re
     
     # Initialize default structure based on procedure type
     fee_structure = {
@@ -257,24 +267,25 @@ def parse_fees_from_results(results: List[Dict[str, Any]], proc_type: str, form_
     for result in results:
         content = result.get("snippet", "").lower()
         
-        # Look for fee amounts
-        amounts = re.findall(r'\$(\d+(?:,\d{3})*)', content)
-        amounts = [int(amount.replace(',', '')) for amount in amounts]
+        # Only the first fee amount in a snippet is ever used, so stop at the first match
+        match = _FEE_AMOUNT_RE.search(content)
+        if not match:
+            continue
+        amount = int(match.group(1).replace(',', ''))
         
         # Match fees to the right category
-        if f"form {form_number}" in content.lower() or "filing fee" in content.lower():
-            if amounts:
-                fee_structure["base_fee"] = amounts[0]
+        if f"form {form_number}" in content or "filing fee" in content:
+            fee_structure["base_fee"] = amount
         
-        if "biometric" in content and amounts:
-            fee_structure["biometric_fee"] = amounts[0]
+        if "biometric" in content:
+            fee_structure["biometric_fee"] = amount
         
         # H-1B specific fees
         if proc_type == "h1b":
-            if "fraud prevention" in content and amounts:
-                fee_structure["fraud_prevention_fee"] = amounts[0]
-            if "acwia" in content and amounts:
-                fee_structure["acwia_fee"] = amounts[0]
+            if "fraud prevention" in content:
+                fee_structure["fraud_prevention_fee"] = amount
+            if "acwia" in content:
+                fee_structure["acwia_fee"] = amount
     
     # Calculate total
     fee_structure["total_per_person"] = fee_structure["base_fee"] + fee_structure["biometric_fee"]
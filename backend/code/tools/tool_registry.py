@@ -1,10 +1,15 @@
+import logging
 from typing import List
 from langchain_core.tools import BaseTool
 
+from backend.code.structured_logging import get_logger
+
 from .rag_tool import rag_retrieval_tool
 from .fee_calculator_tool import fee_calculator_tool
 from .web_search_tool import web_search_tool
 
+tool_logger = get_logger("tools")
+
 
 def get_all_tools() -> List[BaseTool]:
     """
@@ -37,5 +42,6 @@ def get_tools_by_agent(agent_name: str) -> List[BaseTool]:
     }
     
     tools = tool_mapping.get(agent_name, [])
-    print(f"Agent '{agent_name}' has access to {len(tools)} tools: {[t.name for t in tools]}")
+    if tool_logger.is_enabled_for(logging.DEBUG):
+        tool_logger.debug("agent_tools_resolved", agent=agent_name, tools=[t.name for t in tools])
     return tools
\ No newline at end of file
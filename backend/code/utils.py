@@ -15,6 +15,7 @@ from pdfminer.high_level import extract_text
 from slugify import slugify
 
 from backend.code.paths import APP_CONFIG_FPATH, DATA_DIR, VECTOR_DB_DIR
+from backend.code.structured_logging import performance_logger
 from backend.code.tools.radix_loader import build_kb, stream_nodes
 
 _RADIX_ROOT = build_kb(Path(DATA_DIR))
@@ -69,7 +70,8 @@ def performance_timer(operation_name: str):
         yield
     finally:
         duration = time.time() - start
-        print(f"PERF: {operation_name} took {duration:.3f}s")
+        performance_logger.debug("operation_timed", operation=operation_name,
+                                 duration_ms=round(duration * 1000, 2))
 
 
 @lru_cache(maxsize=None)